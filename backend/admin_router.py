@@ -11,7 +11,7 @@ from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
-import shutil
+import asyncio
 import uuid
 
 # Import secure authentication
@@ -20,6 +20,7 @@ from auth.models import User
 
 # Import dependencies
 from config.settings import UPLOAD_DIR
+from utils.file_security import save_upload_file
 from rag_service import EnhancedRAGService
 
 # Initialize RAG service lazily
@@ -181,8 +182,7 @@ async def upload_document_for_ingestion(
         file_path = Path(UPLOAD_DIR) / safe_filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, file_path)
         
         # Process document for ingestion
         try:
@@ -54,6 +54,12 @@ class ConversationMemory:
     user_preferences: Dict[str, Any] = field(default_factory=dict)
     conversation_summary: str = ""
     last_updated: datetime = field(default_factory=datetime.now)
+    # Preferences are derived from user messages only, so cache them until one changes
+    _prefs_version: int = field(default=0, repr=False)
+    _prefs_cache: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    _prefs_cache_version: int = field(default=-1, repr=False)
+    # Running per-role message counts for the current message window
+    role_counts: Dict[str, int] = field(default_factory=dict)
     
     def add_message(self, role: str, content: str, message_type: MessageType = MessageType.TEXT, metadata: Optional[Dict] = None):
         """Add a message to the conversation memory"""
@@ -64,6 +70,15 @@ class ConversationMemory:
             'timestamp': datetime.now().isoformat(),
             'metadata': metadata or {}
         }
+        if len(self.messages) == self.messages.maxlen:
+            evicted_role = self.messages[0]['role']
+            self.role_counts[evicted_role] -= 1
+            # Evicting an old user message changes the derived preferences
+            if evicted_role == 'user':
+                self._prefs_version += 1
+        if role == 'user':
+            self._prefs_version += 1
+        self.role_counts[role] = self.role_counts.get(role, 0) + 1
         self.messages.append(message)
         self.last_updated = datetime.now()
         
@@ -78,6 +93,9 @@ class ConversationMemory:
     
     def get_user_preferences(self) -> Dict[str, Any]:
         """Extract user preferences from conversation history"""
+        if self._prefs_cache is not None and self._prefs_cache_version == self._prefs_version:
+            return self._prefs_cache
+        
         preferences = {
             'budget_range': None,
             'preferred_locations': [],
@@ -140,4 +158,6 @@ class ConversationMemory:
                 if bathroom_match:
                     preferences['bathrooms'] = float(bathroom_match.group(1))
         
+        self._prefs_cache = preferences
+        self._prefs_cache_version = self._prefs_version
         return preferences
@@ -515,10 +515,6 @@ IMPORTANT: Provide specific Dubai real estate information, actual prices, and ac
         try:
             memory = self._get_conversation_memory(session_id)
             
-            # Extract key information from conversation
-            user_messages = [msg for msg in memory.messages if msg['role'] == 'user']
-            assistant_messages = [msg for msg in memory.messages if msg['role'] == 'assistant']
-            
             # Get user preferences
             user_preferences = memory.get_user_preferences()
             
@@ -529,8 +525,8 @@ IMPORTANT: Provide specific Dubai real estate information, actual prices, and ac
                 'session_id': session_id,
                 'conversation_id': memory.conversation_id,
                 'message_count': len(memory.messages),
-                'user_messages': len(user_messages),
-                'assistant_messages': len(assistant_messages),
+                'user_messages': memory.role_counts.get('user', 0),
+                'assistant_messages': memory.role_counts.get('assistant', 0),
                 'user_preferences': user_preferences,
                 'topics': topics,
                 'last_updated': memory.last_updated.isoformat(),
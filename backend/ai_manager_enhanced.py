@@ -12,6 +12,7 @@ This module provides improved AI responses with:
 import json
 import logging
 import os
+import re
 from typing import Dict, Any, Optional, List
 from sqlalchemy import create_engine, text
 from datetime import datetime
@@ -19,6 +20,77 @@ import google.generativeai as genai
 
 logger = logging.getLogger(__name__)
 
+# Keyword groups in priority order; the first group with a hit wins
+INTENT_KEYWORDS = (
+    ("property_search", ("find", "search", "looking for", "property", "apartment", "villa")),
+    ("market_analysis", ("price", "cost", "value", "worth", "market")),
+    ("golden_visa", ("golden visa", "visa", "residency")),
+    ("rental_analysis", ("rental", "rent", "yield", "roi")),
+    ("procedure_guidance", ("process", "procedure", "step", "how to")),
+)
+
+SENTIMENT_KEYWORDS = (
+    ("urgent", ("urgent", "quick", "asap", "immediately")),
+    ("positive", ("thank", "great", "excellent", "amazing")),
+)
+
+_KEYWORD_CATEGORY = {
+    keyword: category
+    for category, keywords in INTENT_KEYWORDS + SENTIMENT_KEYWORDS
+    for keyword in keywords
+}
+
+# Single-pass substring scanner; the lookahead lets overlapping keywords all match
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORD_CATEGORY, key=len, reverse=True)) + "))"
+)
+
+def _first_hit(groups, hits: set, default: str) -> str:
+    return next((category for category, _ in groups if category in hits), default)
+
+SUGGESTED_ACTIONS = {
+    "property_search": ("schedule_viewing", "get_property_list", "area_analysis"),
+    "market_analysis": ("market_report", "investment_consultation", "trend_analysis"),
+    "golden_visa": ("visa_consultation", "property_selection", "application_guidance"),
+    "rental_analysis": ("rental_report", "yield_calculation", "investment_advice"),
+    "procedure_guidance": ("process_consultation", "document_guidance", "legal_advice"),
+}
+DEFAULT_SUGGESTED_ACTIONS = ("contact_agent", "schedule_consultation")
+
+# Prompt templates are built once and filled with str.format per request
+AREA_INFO_TEMPLATE = """
+SPECIFIC AREA INFORMATION:
+- Area: {area}
+- Price Range: {price_range}
+- Rental Yield: {rental_yield}
+- Description: {description}
+- Popular Properties: {popular_properties}
+"""
+
+ENHANCED_PROMPT_TEMPLATE = """
+You are an expert Dubai real estate AI assistant with deep knowledge of the local market.
+
+USER QUERY: {message}
+QUERY INTENT: {intent}
+
+RESPONSE REQUIREMENTS:
+1. **NO GENERIC ERROR MESSAGES** - Do not start with "I'm having trouble processing" or similar
+2. **Provide specific Dubai real estate information** - Include actual prices, areas, developers
+3. **Use structured formatting** - Headers, bullet points, bold keywords
+4. **Include actionable insights** - Specific next steps and recommendations
+5. **Be professional and expert-like** - Use real estate terminology
+6. **Focus on the specific intent** - {intent}
+
+DUBAI REAL ESTATE KNOWLEDGE:
+{area_info}
+- **Popular Areas**: Dubai Marina (AED 1.2M-8M), Downtown Dubai (AED 1.5M-15M), Palm Jumeirah (AED 3M-50M)
+- **Developers**: Emaar, Damac, Nakheel, Sobha, Dubai Properties, Meraas, Azizi, Ellington
+- **Market Trends**: 2024 shows 15-20% appreciation, rental yields 5-8%, strong demand for 1-2BR apartments
+- **Investment Benefits**: Golden Visa eligibility, 0% income tax, high rental yields, strong capital appreciation
+
+Provide a direct, helpful response without any error prefixes. Focus on being informative and actionable.
+"""
+
 class EnhancedAIEnhancementManager:
     """Enhanced AI manager with better response quality"""
     
@@ -138,19 +210,10 @@ class EnhancedAIEnhancementManager:
     def _analyze_query(self, message: str) -> Dict[str, Any]:
         """Analyze user query to understand intent and extract entities"""
         message_lower = message.lower()
+        hits = {_KEYWORD_CATEGORY[m.group(1)] for m in _KEYWORD_RE.finditer(message_lower)}
         
         # Intent detection
-        intent = "general_inquiry"
-        if any(word in message_lower for word in ["find", "search", "looking for", "property", "apartment", "villa"]):
-            intent = "property_search"
-        elif any(word in message_lower for word in ["price", "cost", "value", "worth", "market"]):
-            intent = "market_analysis"
-        elif any(word in message_lower for word in ["golden visa", "visa", "residency"]):
-            intent = "golden_visa"
-        elif any(word in message_lower for word in ["rental", "rent", "yield", "roi"]):
-            intent = "rental_analysis"
-        elif any(word in message_lower for word in ["process", "procedure", "step", "how to"]):
-            intent = "procedure_guidance"
+        intent = _first_hit(INTENT_KEYWORDS, hits, "general_inquiry")
         
         # Entity extraction
         entities = {}
@@ -160,11 +223,7 @@ class EnhancedAIEnhancementManager:
                 break
         
         # Sentiment analysis
-        sentiment = "neutral"
-        if any(word in message_lower for word in ["urgent", "quick", "asap", "immediately"]):
-            sentiment = "urgent"
-        elif any(word in message_lower for word in ["thank", "great", "excellent", "amazing"]):
-            sentiment = "positive"
+        sentiment = _first_hit(SENTIMENT_KEYWORDS, hits, "neutral")
         
         return {
             'intent': intent,
@@ -208,38 +267,15 @@ class EnhancedAIEnhancementManager:
         area_info = ""
         if "area" in entities:
             area_data = self.dubai_knowledge["areas"][entities["area"]]
-            area_info = f"""
-SPECIFIC AREA INFORMATION:
-- Area: {entities['area'].replace('_', ' ').title()}
-- Price Range: {area_data['price_range']}
-- Rental Yield: {area_data['rental_yield']}
-- Description: {area_data['description']}
-- Popular Properties: {', '.join(area_data['popular_properties'])}
-"""
+            area_info = AREA_INFO_TEMPLATE.format(
+                area=entities['area'].replace('_', ' ').title(),
+                price_range=area_data['price_range'],
+                rental_yield=area_data['rental_yield'],
+                description=area_data['description'],
+                popular_properties=', '.join(area_data['popular_properties'])
+            )
         
-        return f"""
-You are an expert Dubai real estate AI assistant with deep knowledge of the local market.
-
-USER QUERY: {message}
-QUERY INTENT: {intent}
-
-RESPONSE REQUIREMENTS:
-1. **NO GENERIC ERROR MESSAGES** - Do not start with "I'm having trouble processing" or similar
-2. **Provide specific Dubai real estate information** - Include actual prices, areas, developers
-3. **Use structured formatting** - Headers, bullet points, bold keywords
-4. **Include actionable insights** - Specific next steps and recommendations
-5. **Be professional and expert-like** - Use real estate terminology
-6. **Focus on the specific intent** - {intent}
-
-DUBAI REAL ESTATE KNOWLEDGE:
-{area_info}
-- **Popular Areas**: Dubai Marina (AED 1.2M-8M), Downtown Dubai (AED 1.5M-15M), Palm Jumeirah (AED 3M-50M)
-- **Developers**: Emaar, Damac, Nakheel, Sobha, Dubai Properties, Meraas, Azizi, Ellington
-- **Market Trends**: 2024 shows 15-20% appreciation, rental yields 5-8%, strong demand for 1-2BR apartments
-- **Investment Benefits**: Golden Visa eligibility, 0% income tax, high rental yields, strong capital appreciation
-
-Provide a direct, helpful response without any error prefixes. Focus on being informative and actionable.
-"""
+        return ENHANCED_PROMPT_TEMPLATE.format(message=message, intent=intent, area_info=area_info)
     
     def _generate_template_response(self, message: str, intent: str, entities: Dict[str, Any]) -> str:
         """Generate template-based response when AI model is unavailable"""
@@ -514,14 +550,7 @@ Would you like me to help you with any specific aspect of Dubai real estate?
     
     def _get_suggested_actions(self, intent: str) -> List[str]:
         """Get suggested actions based on intent"""
-        actions_map = {
-            "property_search": ["schedule_viewing", "get_property_list", "area_analysis"],
-            "market_analysis": ["market_report", "investment_consultation", "trend_analysis"],
-            "golden_visa": ["visa_consultation", "property_selection", "application_guidance"],
-            "rental_analysis": ["rental_report", "yield_calculation", "investment_advice"],
-            "procedure_guidance": ["process_consultation", "document_guidance", "legal_advice"]
-        }
-        return actions_map.get(intent, ["contact_agent", "schedule_consultation"])
+        return list(SUGGESTED_ACTIONS.get(intent, DEFAULT_SUGGESTED_ACTIONS))
     
     def _extract_user_preferences(self, message: str, query_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Extract user preferences from the message"""
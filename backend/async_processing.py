@@ -9,11 +9,11 @@ from typing import Dict, Any
 import asyncio
 import logging
 from pathlib import Path
-import shutil
 from datetime import datetime
 
 from task_manager import task_manager, TaskStatus
 from intelligent_processor import IntelligentDataProcessor
+from utils.file_security import save_upload_file
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,7 @@ async def analyze_file_async(
     file_path = temp_dir / file.filename
     
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, file_path)
 
         # Get the file type (e.g., 'pdf', 'csv')
         file_type = file.filename.split('.')[-1].lower()
@@ -4,7 +4,6 @@ Database connection and session management for authentication
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 import logging
 from typing import Generator
@@ -13,11 +12,15 @@ from config.settings import DATABASE_URL
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Create database engine
+# Create database engine; sized so concurrent requests don't queue on a single shared connection
 engine = create_engine(
     DATABASE_URL,
-    poolclass=StaticPool,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
     pool_pre_ping=True,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=10000,
     echo=False  # Set to True for SQL debugging
 )
 
@@ -81,7 +84,8 @@ def init_default_data():
     from .utils import hash_password
     from datetime import datetime
     
-    db = SessionLocal()
+    # Seed-only session: nothing here relies on autoflush or reloading after commit
+    db = SessionLocal(expire_on_commit=False)
     try:
         # Check if default data already exists
         if db.query(Role).first():
@@ -108,9 +112,6 @@ def init_default_data():
             Permission(name="admin_access", description="Full administrative access", resource="admin", action="all"),
         ]
         
-        for permission in permissions:
-            db.add(permission)
-        
         # Create default roles
         agent_role = Role(
             name="agent",
@@ -128,25 +129,24 @@ def init_default_data():
             description="System administrators and managers"
         )
         
-        db.add_all([agent_role, employee_role, admin_role])
-        db.flush()  # Flush to get IDs
+        # Assign permissions to roles from the objects created above,
+        # rather than re-querying the permissions table per role
+        permissions_by_name = {permission.name: permission for permission in permissions}
         
-        # Assign permissions to roles
         # Agent permissions
-        agent_permissions = db.query(Permission).filter(
-            Permission.name.in_(["property_read", "property_write", "chat_read", "chat_write", "user_read"])
-        ).all()
-        agent_role.permissions = agent_permissions
+        agent_role.permissions = [
+            permissions_by_name[name]
+            for name in ("property_read", "property_write", "chat_read", "chat_write", "user_read")
+        ]
         
         # Employee permissions
-        employee_permissions = db.query(Permission).filter(
-            Permission.name.in_(["property_read", "property_write", "chat_read", "chat_write", "user_read", "user_write"])
-        ).all()
-        employee_role.permissions = employee_permissions
+        employee_role.permissions = [
+            permissions_by_name[name]
+            for name in ("property_read", "property_write", "chat_read", "chat_write", "user_read", "user_write")
+        ]
         
         # Admin permissions
-        admin_permissions = db.query(Permission).all()
-        admin_role.permissions = admin_permissions
+        admin_role.permissions = list(permissions)
         
         # Create default admin user
         admin_user = User(
@@ -160,7 +160,8 @@ def init_default_data():
             created_at=datetime.utcnow()
         )
         
-        db.add(admin_user)
+        # Add everything in one go so the commit flushes each table as a single batch
+        db.add_all(permissions + [agent_role, employee_role, admin_role, admin_user])
         db.commit()
         
         logger.info("Default roles, permissions, and admin user created successfully")
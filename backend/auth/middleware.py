@@ -5,6 +5,7 @@ Authentication middleware for JWT validation, RBAC, and security
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import JSONResponse
+from sqlalchemy import select, update, bindparam, true, or_
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any, List
 import logging
@@ -12,8 +13,8 @@ import time
 from datetime import datetime, timedelta
 import json
 
-from .database import get_db
-from .models import User, UserSession, Role, Permission, AuditLog
+from .database import get_db, engine
+from .models import User, UserSession, Permission, AuditLog, RoleCode, ROLE_CODES
 from .utils import verify_jwt_token, sanitize_input
 from .rate_limiter import RateLimiter
 
@@ -25,6 +26,29 @@ security = HTTPBearer()
 # Rate limiter instance
 rate_limiter = RateLimiter()
 
+# Statements for the per-request auth lookups, built once with bound parameters
+# so each request reuses the same construct (and its compiled-cache entry)
+_user_by_id_stmt = select(User).where(User.id == bindparam("user_id"))
+_active_session_stmt = select(UserSession).where(
+    UserSession.user_id == bindparam("user_id"),
+    UserSession.session_token == bindparam("session_token"),
+    UserSession.is_active == true()
+)
+# last_used is only refreshed when it is older than this, so most requests don't write at all
+SESSION_TOUCH_INTERVAL = timedelta(seconds=60)
+# Touch last_used with a single UPDATE; committing an ORM change here would expire the
+# user object and force a reload on the first attribute access in the endpoint. The
+# staleness condition makes concurrent requests on the same token skip the write.
+_touch_session_stmt = (
+    update(UserSession)
+    .where(
+        UserSession.id == bindparam("session_id"),
+        or_(UserSession.last_used.is_(None), UserSession.last_used < bindparam("stale_before"))
+    )
+    .values(last_used=bindparam("used_at"))
+    .execution_options(synchronize_session=False)
+)
+
 class AuthMiddleware:
     """Authentication middleware class"""
     
@@ -92,7 +116,7 @@ def get_current_user(
         
         # Get user from database
         user_id = int(payload.get("sub"))
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.execute(_user_by_id_stmt, {"user_id": user_id}).scalars().first()
         
         if not user:
             raise HTTPException(
@@ -116,11 +140,10 @@ def get_current_user(
             )
         
         # Check if session is still valid
-        session = db.query(UserSession).filter(
-            UserSession.user_id == user.id,
-            UserSession.session_token == credentials.credentials,
-            UserSession.is_active == True
-        ).first()
+        session = db.execute(
+            _active_session_stmt,
+            {"user_id": user.id, "session_token": credentials.credentials}
+        ).scalars().first()
         
         if not session or session.is_expired:
             raise HTTPException(
@@ -129,9 +152,17 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"}
             )
         
-        # Update session last used time
-        session.last_used = datetime.utcnow()
-        db.commit()
+        # Update session last used time (throttled). It is committed straight away on its own
+        # connection so the row lock isn't held, and the request's connection isn't left
+        # idle-in-transaction, for the rest of the request.
+        now = datetime.utcnow()
+        stale_before = now - SESSION_TOUCH_INTERVAL
+        if session.last_used is None or session.last_used < stale_before:
+            with engine.begin() as conn:
+                conn.execute(
+                    _touch_session_stmt,
+                    {"session_id": session.id, "used_at": now, "stale_before": stale_before}
+                )
         
         return user
         
@@ -172,8 +203,10 @@ def require_roles(required_roles: List[str]):
     Returns:
         Dependency function
     """
+    allowed_codes = frozenset(ROLE_CODES[role] for role in required_roles if role in ROLE_CODES)
+    
     def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in required_roles:
+        if current_user.role_code not in allowed_codes:
             raise HTTPException(
                 status_code=403,
                 detail=f"Access denied. Required roles: {', '.join(required_roles)}"
@@ -181,6 +214,23 @@ def require_roles(required_roles: List[str]):
         return current_user
     return role_checker
 
+def get_user_permissions(user: User) -> frozenset:
+    """
+    Permission names granted through the user's roles
+    
+    Roles and their permissions are selectin-loaded with the user, so this needs no
+    extra query; the result is memoized on the instance, which lives for one request.
+    """
+    permissions = getattr(user, "_permission_names", None)
+    if permissions is None:
+        permissions = frozenset(
+            permission.name
+            for role in user.user_roles_rel
+            for permission in role.permissions
+        )
+        user._permission_names = permissions
+    return permissions
+
 def require_permissions(required_permissions: List[str]):
     """
     Decorator to require specific permissions
@@ -191,22 +241,11 @@ def require_permissions(required_permissions: List[str]):
     Returns:
         Dependency function
     """
-    def permission_checker(
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-    ) -> User:
-        # Get user's roles and their permissions
-        user_roles = db.query(Role).join(
-            Role.users
-        ).filter(User.id == current_user.id).all()
-        
-        user_permissions = set()
-        for role in user_roles:
-            for permission in role.permissions:
-                user_permissions.add(permission.name)
-        
+    required = frozenset(required_permissions)
+    
+    def permission_checker(current_user: User = Depends(get_current_user)) -> User:
         # Check if user has all required permissions
-        missing_permissions = set(required_permissions) - user_permissions
+        missing_permissions = required - get_user_permissions(current_user)
         if missing_permissions:
             raise HTTPException(
                 status_code=403,
@@ -287,21 +326,24 @@ def validate_input_data():
     return input_validator
 
 # Convenience functions for common role checks
+_AGENT_OR_ADMIN = frozenset({RoleCode.AGENT, RoleCode.ADMIN})
+_EMPLOYEE_OR_ADMIN = frozenset({RoleCode.EMPLOYEE, RoleCode.ADMIN})
+
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Require admin role"""
-    if current_user.role != "admin":
+    if current_user.role_code is not RoleCode.ADMIN:
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
 def require_agent_or_admin(current_user: User = Depends(get_current_user)) -> User:
     """Require agent or admin role"""
-    if current_user.role not in ["agent", "admin"]:
+    if current_user.role_code not in _AGENT_OR_ADMIN:
         raise HTTPException(status_code=403, detail="Agent or admin access required")
     return current_user
 
 def require_employee_or_admin(current_user: User = Depends(get_current_user)) -> User:
     """Require employee or admin role"""
-    if current_user.role not in ["employee", "admin"]:
+    if current_user.role_code not in _EMPLOYEE_OR_ADMIN:
         raise HTTPException(status_code=403, detail="Employee or admin access required")
     return current_user
 
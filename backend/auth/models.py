@@ -2,14 +2,24 @@
 Authentication models for Dubai Real Estate RAG System
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Table
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Table, DDL, event, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from datetime import datetime
-import uuid
+from enum import IntEnum
+from typing import List, Optional
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+class RoleCode(IntEnum):
+    """Integer codes for the string roles stored on User.role"""
+    CLIENT = 1
+    AGENT = 2
+    EMPLOYEE = 3
+    ADMIN = 4
+
+# Role name -> code, resolved once per lookup instead of chained string comparisons
+ROLE_CODES = {code.name.lower(): code for code in RoleCode}
 
 # Association tables for many-to-many relationships
 role_permissions = Table(
@@ -30,26 +40,29 @@ class User(Base):
     """User model for authentication and authorization"""
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    first_name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
-    role = Column(String(50), default='client')  # client, agent, employee, admin
-    is_active = Column(Boolean, default=True)
-    email_verified = Column(Boolean, default=False)
-    email_verification_token = Column(String(255), unique=True, nullable=True)
-    password_reset_token = Column(String(255), unique=True, nullable=True)
-    password_reset_expires = Column(DateTime, nullable=True)
-    last_login = Column(DateTime, nullable=True)
-    failed_login_attempts = Column(Integer, default=0)
-    locked_until = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255))
+    first_name: Mapped[str] = mapped_column(String(100))
+    last_name: Mapped[str] = mapped_column(String(100))
+    role: Mapped[Optional[str]] = mapped_column(String(50), default='client')  # client, agent, employee, admin
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
+    email_verified: Mapped[Optional[bool]] = mapped_column(default=False)
+    email_verification_token: Mapped[Optional[str]] = mapped_column(String(255), unique=True)
+    password_reset_token: Mapped[Optional[str]] = mapped_column(String(255), unique=True)
+    password_reset_expires: Mapped[Optional[datetime]]
+    last_login: Mapped[Optional[datetime]]
+    failed_login_attempts: Mapped[Optional[int]] = mapped_column(default=0)
+    locked_until: Mapped[Optional[datetime]]
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
+    updated_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     
     # Relationships
-    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
-    user_roles_rel = relationship("Role", secondary=user_roles, back_populates="users")
+    # Session rows are removed by the FK's ON DELETE CASCADE rather than loaded and deleted one by one
+    sessions: Mapped[List["UserSession"]] = relationship(back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    # Roles and their permissions are read together on every permission check, so
+    # load them with batched IN queries instead of one lazy SELECT per object
+    user_roles_rel: Mapped[List["Role"]] = relationship(secondary=user_roles, back_populates="users", lazy="selectin")
     
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
@@ -58,6 +71,11 @@ class User(Base):
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
     
+    @property
+    def role_code(self):
+        """Integer code for the user's role, or None for unknown roles"""
+        return ROLE_CODES.get(self.role)
+    
     @property
     def is_locked(self):
         if self.locked_until and self.locked_until > datetime.utcnow():
@@ -68,19 +86,24 @@ class UserSession(Base):
     """User session model for tracking active sessions"""
     __tablename__ = "user_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    session_token = Column(String(255), unique=True, nullable=False, index=True)
-    refresh_token = Column(String(255), unique=True, nullable=False, index=True)
-    ip_address = Column(String(45), nullable=True)  # IPv6 compatible
-    user_agent = Column(Text, nullable=True)
-    expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=func.now())
-    last_used = Column(DateTime, default=func.now())
-    is_active = Column(Boolean, default=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    session_token: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    refresh_token: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))  # IPv6 compatible
+    # Large text columns below are only read on demand, not on every session/permission lookup
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    expires_at: Mapped[datetime]
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
+    last_used: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
     
     # Relationships
-    user = relationship("User", back_populates="sessions")
+    user: Mapped["User"] = relationship(back_populates="sessions")
+    
+    # Fetch server-side timestamp defaults with RETURNING on insert instead of a later SELECT;
+    # sessions removed through User.sessions skip the deleted-row count check
+    __mapper_args__ = {"eager_defaults": True, "confirm_deleted_rows": False}
     
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id}, expires_at='{self.expires_at}')>"
@@ -93,15 +116,15 @@ class Permission(Base):
     """Permission model for fine-grained access control"""
     __tablename__ = "permissions"
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    resource = Column(String(100), nullable=False)  # e.g., 'property', 'user', 'chat'
-    action = Column(String(50), nullable=False)     # e.g., 'read', 'write', 'delete'
-    created_at = Column(DateTime, default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    resource: Mapped[str] = mapped_column(String(100))  # e.g., 'property', 'user', 'chat'
+    action: Mapped[str] = mapped_column(String(50))     # e.g., 'read', 'write', 'delete'
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     
     # Relationships
-    roles = relationship("Role", secondary=role_permissions, back_populates="permissions")
+    roles: Mapped[List["Role"]] = relationship(secondary=role_permissions, back_populates="permissions")
     
     def __repr__(self):
         return f"<Permission(id={self.id}, name='{self.name}', resource='{self.resource}', action='{self.action}')>"
@@ -110,16 +133,16 @@ class Role(Base):
     """Role model for role-based access control"""
     __tablename__ = "roles"
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    is_default = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    is_default: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
+    updated_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
     
     # Relationships
-    permissions = relationship("Permission", secondary=role_permissions, back_populates="roles")
-    users = relationship("User", secondary=user_roles, back_populates="user_roles_rel")
+    permissions: Mapped[List["Permission"]] = relationship(secondary=role_permissions, back_populates="roles", lazy="selectin")
+    users: Mapped[List["User"]] = relationship(secondary=user_roles, back_populates="user_roles_rel")
     
     def __repr__(self):
         return f"<Role(id={self.id}, name='{self.name}', is_default={self.is_default})>"
@@ -135,15 +158,37 @@ class AuditLog(Base):
     """Audit log model for security event tracking"""
     __tablename__ = "audit_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    event_type = Column(String(100), nullable=False)  # login, logout, password_change, etc.
-    event_data = Column(Text, nullable=True)  # JSON string with event details
-    ip_address = Column(String(45), nullable=True)
-    user_agent = Column(Text, nullable=True)
-    success = Column(Boolean, default=True)
-    error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"))
+    event_type: Mapped[str] = mapped_column(String(100))  # login, logout, password_change, etc.
+    event_data: Mapped[Optional[str]] = mapped_column(Text, deferred=True)  # JSON string with event details
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    success: Mapped[Optional[bool]] = mapped_column(default=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=text("CURRENT_TIMESTAMP"))
+    
+    # Fetch the server-side created_at with RETURNING on insert instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<AuditLog(id={self.id}, event_type='{self.event_type}', user_id={self.user_id}, success={self.success})>"
+
+# updated_at is maintained by the database so inserts and updates carry no timestamp parameters
+_set_updated_at_function = DDL("""
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+""")
+event.listen(Base.metadata, "after_create", _set_updated_at_function.execute_if(dialect="postgresql"))
+
+for _table in (User.__table__, Role.__table__):
+    for _statement in (
+        f"DROP TRIGGER IF EXISTS trg_{_table.name}_updated_at ON {_table.name}",
+        f"CREATE TRIGGER trg_{_table.name}_updated_at BEFORE UPDATE ON {_table.name} "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+    ):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
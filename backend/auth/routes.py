@@ -4,6 +4,7 @@ Authentication routes for login, register, logout, and password management
 
 from fastapi import APIRouter, HTTPException, Depends, Request, status
 from fastapi.security import HTTPBearer
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Dict, Any
@@ -28,6 +29,20 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 # Security scheme
 security = HTTPBearer()
 
+# Roles a user may pick at self-registration, in the order listed in error messages
+REGISTRATION_ROLES = ("agent", "employee", "admin")
+
+# Unique constraint on users.email: init_database.py's UNIQUE column / the ORM's unique index
+USER_EMAIL_UNIQUE_CONSTRAINTS = ("users_email_key", "ix_users_email")
+
+def _is_duplicate_email(exc: IntegrityError) -> bool:
+    """True only for a unique violation (SQLSTATE 23505) on the users.email constraint"""
+    orig = exc.orig
+    if getattr(orig, "pgcode", None) != "23505":
+        return False
+    diag = getattr(orig, "diag", None)
+    return getattr(diag, "constraint_name", None) in USER_EMAIL_UNIQUE_CONSTRAINTS
+
 # Pydantic models for request/response
 class UserRegister(BaseModel):
     email: EmailStr
@@ -93,14 +108,6 @@ async def register(
                 detail="Invalid email address"
             )
         
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
         # Validate password strength
         password_validation = validate_password_strength(user_data.password)
         if not password_validation["is_valid"]:
@@ -110,11 +117,10 @@ async def register(
             )
         
         # Validate role
-        valid_roles = ["agent", "employee", "admin"]
-        if user_data.role not in valid_roles:
+        if user_data.role not in REGISTRATION_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid role. Must be one of: {', '.join(valid_roles)}"
+                detail=f"Invalid role. Must be one of: {', '.join(REGISTRATION_ROLES)}"
             )
         
         # Sanitize input
@@ -135,7 +141,18 @@ async def register(
         )
         
         db.add(new_user)
-        db.flush()  # Get the user ID
+        try:
+            # Get the user ID; the unique email constraint rejects existing accounts
+            # without a separate lookup and without racing a concurrent registration
+            db.flush()
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_duplicate_email(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
         
         # Generate tokens
         access_token = generate_access_token(new_user.id, new_user.email, new_user.role)
@@ -154,9 +171,8 @@ async def register(
         )
         
         db.add(session)
-        db.commit()
         
-        # Log audit event
+        # Log audit event in the same transaction as the new session
         audit_log = AuditLog(
             user_id=new_user.id,
             event_type="user_registration",
@@ -166,10 +182,10 @@ async def register(
             success=True
         )
         db.add(audit_log)
-        db.commit()
         
-        # Return response
-        return TokenResponse(
+        # Build the response before committing; reading the user afterwards would reload
+        # the expired row with another SELECT
+        response = TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=30 * 60,  # 30 minutes in seconds
@@ -183,6 +199,9 @@ async def register(
                 "email_verified": new_user.email_verified
             }
         )
+        db.commit()
+        
+        return response
         
     except HTTPException:
         raise
@@ -290,9 +309,8 @@ async def login(
         )
         
         db.add(session)
-        db.commit()
         
-        # Log audit event
+        # Log audit event in the same transaction as the new session
         audit_log = AuditLog(
             user_id=user.id,
             event_type="user_login",
@@ -302,9 +320,10 @@ async def login(
             success=True
         )
         db.add(audit_log)
-        db.commit()
         
-        return TokenResponse(
+        # Build the response before committing; reading the user afterwards would reload
+        # the expired row with another SELECT
+        response = TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=30 * 60,
@@ -318,6 +337,9 @@ async def login(
                 "email_verified": user.email_verified
             }
         )
+        db.commit()
+        
+        return response
         
     except HTTPException:
         raise
@@ -355,9 +377,8 @@ async def logout(
         
         if session:
             session.is_active = False
-            db.commit()
             
-            # Log audit event
+            # Log audit event in the same transaction as the logout
             audit_log = AuditLog(
                 user_id=session.user_id,
                 event_type="user_logout",
@@ -496,13 +517,11 @@ async def forgot_password(
         user.password_reset_token = reset_token
         user.password_reset_expires = datetime.utcnow() + timedelta(hours=1)
         
-        db.commit()
-        
         # TODO: Send email with reset link
         # For now, just log the token (in production, send email)
         logger.info(f"Password reset token for {user.email}: {reset_token}")
         
-        # Log audit event
+        # Log audit event in the same transaction as the reset token
         audit_log = AuditLog(
             user_id=user.id,
             event_type="password_reset_requested",
@@ -567,9 +586,7 @@ async def reset_password(
             UserSession.is_active: False
         })
         
-        db.commit()
-        
-        # Log audit event
+        # Log audit event in the same transaction as the password change
         audit_log = AuditLog(
             user_id=user.id,
             event_type="password_reset_completed",
@@ -15,6 +15,9 @@ from config.settings import SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from free-text user input
+_UNSAFE_INPUT_CHARS_RE = re.compile(r'[<>"\']')
+
 # JWT Configuration
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = ACCESS_TOKEN_EXPIRE_MINUTES
@@ -243,7 +246,7 @@ def sanitize_input(text: str) -> str:
         return ""
     
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', text)
+    sanitized = _UNSAFE_INPUT_CHARS_RE.sub('', text)
     
     # Remove extra whitespace
     sanitized = ' '.join(sanitized.split())
@@ -22,17 +22,29 @@ logger = logging.getLogger(__name__)
 class CacheManager:
     """Redis cache manager for RAG system performance optimization"""
     
-    def __init__(self, redis_host: str = "localhost", redis_port: int = 6379, redis_db: int = 0):
-        """Initialize Redis connection"""
+    def __init__(self, redis_host: str = "localhost", redis_port: int = 6379, redis_db: int = 0,
+                 redis_url: Optional[str] = None):
+        """Initialize Redis connection, from redis_url when given (keeps credentials and rediss:// TLS)"""
         try:
-            self.redis_client = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
-                decode_responses=False,  # Keep binary for pickle
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
+            if redis_url:
+                self.redis_client = redis.Redis.from_url(
+                    redis_url,
+                    decode_responses=False,  # Keep binary for pickle
+                    socket_connect_timeout=5,
+                    socket_timeout=5
+                )
+                connection_kwargs = self.redis_client.connection_pool.connection_kwargs
+                redis_host = connection_kwargs.get("host", redis_host)
+                redis_port = connection_kwargs.get("port", redis_port)
+            else:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=False,  # Keep binary for pickle
+                    socket_connect_timeout=5,
+                    socket_timeout=5
+                )
             # Test connection
             self.redis_client.ping()
             logger.info(f"✅ Redis cache connected successfully to {redis_host}:{redis_port}")
@@ -42,6 +54,11 @@ class CacheManager:
             self.cache_enabled = False
             self.redis_client = None
     
+    @classmethod
+    def from_url(cls, redis_url: str) -> "CacheManager":
+        """Create a cache manager from a redis:// or rediss:// URL"""
+        return cls(redis_url=redis_url)
+    
     def _generate_cache_key(self, prefix: str, data: Any) -> str:
         """Generate a unique cache key based on data"""
         if isinstance(data, str):
@@ -257,16 +274,53 @@ class CacheManager:
             logger.error(f"Error retrieving cached frequent query: {e}")
             return None
     
+    def cache_response_body(self, prefix: str, key_data: Any, body: bytes, ttl: int = 60) -> bool:
+        """Cache an already-serialized HTTP response body"""
+        if not self.cache_enabled:
+            return False
+        
+        try:
+            cache_key = self._generate_cache_key(prefix, key_data)
+            self.redis_client.setex(cache_key, ttl, body)
+            
+            logger.debug(f"Cached response body: {cache_key}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error caching response body: {e}")
+            return False
+    
+    def get_cached_response_body(self, prefix: str, key_data: Any) -> Optional[bytes]:
+        """Retrieve a cached HTTP response body, stored as raw bytes so it can be returned as-is"""
+        if not self.cache_enabled:
+            return None
+        
+        try:
+            cache_key = self._generate_cache_key(prefix, key_data)
+            return self.redis_client.get(cache_key)
+            
+        except Exception as e:
+            logger.error(f"Error retrieving cached response body: {e}")
+            return None
+    
     def invalidate_cache_pattern(self, pattern: str) -> bool:
         """Invalidate cache entries matching a pattern"""
         if not self.cache_enabled:
             return False
         
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                self.redis_client.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache entries matching pattern: {pattern}")
+            # SCAN walks the keyspace incrementally; KEYS would block Redis for every other client
+            deleted = 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
+            if deleted:
+                logger.info(f"Invalidated {deleted} cache entries matching pattern: {pattern}")
                 return True
             return False
             
@@ -6,7 +6,7 @@ migrated from main.py to maintain frontend compatibility while following
 the secure architecture patterns of main_secure.py.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional, Union
@@ -99,6 +99,10 @@ class ChatResponse(BaseModel):
     metadata: Dict[str, Any] = {}
 
 # Helper Functions
+def json_response(model: BaseModel) -> Response:
+    """Serialize an already-validated model directly, skipping FastAPI's response re-validation"""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 def get_ai_manager():
     """Get AI manager instance"""
     try:
@@ -113,15 +117,32 @@ def get_ai_manager():
         print(f"Error initializing AI manager: {e}")
         return None
 
+_rag_service = None
+
 def get_rag_service():
-    """Get RAG service instance"""
-    try:
-        from rag_service import EnhancedRAGService
-        from config.settings import CHROMA_HOST, CHROMA_PORT
-        return EnhancedRAGService()
-    except Exception as e:
-        print(f"Error initializing RAG service: {e}")
-        return None
+    """Get the shared RAG service instance (its response cache and in-flight calls are per instance)"""
+    global _rag_service
+    if _rag_service is None:
+        try:
+            _rag_service = EnhancedRAGService()
+        except Exception as e:
+            print(f"Error initializing RAG service: {e}")
+            return None
+    return _rag_service
+
+def save_message_pair(conn, conversation_id, user_content, user_metadata, assistant_content, assistant_metadata):
+    """Persist a user message and the assistant reply in a single INSERT round trip"""
+    conn.execute(text("""
+        INSERT INTO messages (conversation_id, role, content, message_type, metadata)
+        VALUES (:conversation_id, 'user', :user_content, 'text', :user_metadata),
+               (:conversation_id, 'assistant', :assistant_content, 'text', :assistant_metadata)
+    """), {
+        "conversation_id": conversation_id,
+        "user_content": user_content,
+        "user_metadata": json.dumps(user_metadata) if user_metadata else None,
+        "assistant_content": assistant_content,
+        "assistant_metadata": json.dumps(assistant_metadata) if assistant_metadata else None
+    })
 
 # Router Endpoints
 
@@ -368,7 +389,10 @@ async def get_chat_session(
             
             messages = []
             for msg_row in messages_result:
-                metadata = json.loads(msg_row[6]) if msg_row[6] else None
+                # psycopg2 already decodes JSONB; only legacy text values need parsing
+                metadata = msg_row[6]
+                if isinstance(metadata, str):
+                    metadata = json.loads(metadata)
                 messages.append(ChatMessageResponse(
                     id=msg_row[0],
                     session_id=session_id,
@@ -404,13 +428,13 @@ async def get_chat_session(
             except:
                 summary_text = None
             
-            return ChatHistoryResponse(
+            return json_response(ChatHistoryResponse(
                 session_id=session_id,
                 title=session_row[3],
                 messages=messages,
                 user_preferences=user_preferences,
                 conversation_summary=summary_text
-            )
+            ))
             
     except HTTPException:
         raise
@@ -462,7 +486,7 @@ async def chat_with_session(
                 response_text = "I'm sorry, I couldn't generate the report at this time. Please try again later."
         else:
             # Use enhanced RAG service with Reelly API integration
-            response_text = rag_service.get_response(
+            response_text = await rag_service.get_response_async(
                 message=request.message,
                 role=current_user.role,
                 session_id=session_id
@@ -470,35 +494,24 @@ async def chat_with_session(
         
         # Save messages to database
         with get_db_connection() as conn:
-            # Save user message
-            conn.execute(text("""
-                INSERT INTO messages (conversation_id, role, content, message_type, metadata)
-                VALUES (:conversation_id, 'user', :content, 'text', :metadata)
-            """), {
-                "conversation_id": session_row[0],
-                "content": request.message,
-                "metadata": json.dumps({"file_upload": request.file_upload}) if request.file_upload else None
-            })
-            
-            # Save assistant response
-            conn.execute(text("""
-                INSERT INTO messages (conversation_id, role, content, message_type, metadata)
-                VALUES (:conversation_id, 'assistant', :content, 'text', :metadata)
-            """), {
-                "conversation_id": session_row[0],
-                "content": response_text,
-                "metadata": json.dumps({
+            save_message_pair(
+                conn,
+                session_row[0],
+                request.message,
+                {"file_upload": request.file_upload} if request.file_upload else None,
+                response_text,
+                {
                     "sources": ["Dubai Real Estate Database", "Market Analysis Reports", "Reelly API"],
                     "enhanced": True,
                     "reelly_integration": True
-                })
-            })
+                }
+            )
         
         # Track performance
         end_time = time.time()
         response_time = end_time - start_time
         
-        return ChatResponse(
+        return json_response(ChatResponse(
             response=response_text,
             session_id=session_id,
             message_id=str(uuid.uuid4()),
@@ -515,7 +528,7 @@ async def chat_with_session(
                 "enhanced": True,
                 "reelly_integration": True
             }
-        )
+        ))
         
     except HTTPException:
         raise
@@ -698,13 +711,13 @@ async def get_conversation_history(session_id: str):
             if not messages:
                 messages = []
             
-            return ChatHistoryResponse(
+            return json_response(ChatHistoryResponse(
                 session_id=session_id,
                 title=session_row[3] or "New Chat",
                 messages=messages,
                 user_preferences=user_preferences,
                 conversation_summary=summary_text
-            )
+            ))
             
     except HTTPException:
         raise
@@ -730,7 +743,7 @@ async def chat_with_rag(
             raise HTTPException(status_code=500, detail="RAG service not available")
         
         # Use RAG service as the single source of truth for conversational AI
-        response_text = rag_service.get_response(
+        response_text = await rag_service.get_response_async(
             message=request.message,
             role=current_user.role,
             session_id=request.session_id
@@ -748,30 +761,19 @@ async def chat_with_rag(
                     
                     session_row = session_result.fetchone()
                     if session_row:
-                        # Save user message
-                        conn.execute(text("""
-                            INSERT INTO messages (conversation_id, role, content, message_type, metadata)
-                            VALUES (:conversation_id, 'user', :content, 'text', :metadata)
-                        """), {
-                            "conversation_id": session_row[0],
-                            "content": request.message,
-                            "metadata": json.dumps({"file_upload": request.file_upload}) if request.file_upload else None
-                        })
-                        
-                        # Save assistant response
-                        conn.execute(text("""
-                            INSERT INTO messages (conversation_id, role, content, message_type, metadata)
-                            VALUES (:conversation_id, 'assistant', :content, 'text', :metadata)
-                        """), {
-                            "conversation_id": session_row[0],
-                            "content": response_text,
-                            "metadata": json.dumps({"sources": ["Dubai Real Estate Database", "Market Analysis Reports"]})
-                        })
+                        save_message_pair(
+                            conn,
+                            session_row[0],
+                            request.message,
+                            {"file_upload": request.file_upload} if request.file_upload else None,
+                            response_text,
+                            {"sources": ["Dubai Real Estate Database", "Market Analysis Reports"]}
+                        )
             except Exception as db_error:
                 print(f"Database error in chat endpoint: {db_error}")
                 # Continue without saving to database
         
-        return ChatResponse(
+        return json_response(ChatResponse(
             response=response_text,
             session_id=request.session_id,
             message_id=str(uuid.uuid4()),
@@ -780,7 +782,7 @@ async def chat_with_rag(
             confidence=0.8,
             intent="general",
             metadata={}
-        )
+        ))
         
     except Exception as e:
         print(f"Error in chat endpoint: {e}")
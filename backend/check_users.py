@@ -3,10 +3,6 @@
 Check users in the database
 """
 
-import sys
-import os
-sys.path.append('/app')
-
 from auth.database import get_db_context
 from auth.models import User
 
@@ -6,7 +6,7 @@ This service manages fetching, caching, and providing context data for detected
 
 import json
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import logging
 from sqlalchemy import text
@@ -20,6 +20,28 @@ class ContextManagementService:
     def __init__(self):
         self.cache_duration = timedelta(hours=1)  # Cache for 1 hour
         self.max_cache_size = 1000  # Maximum cached items
+        self._agent_contacts: Dict[int, Tuple[datetime, str, Optional[str]]] = {}
+    
+    def _get_agent_contact(self, conn, agent_id: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+        """Look up an agent's display name and email, cached for cache_duration so property lookups skip the users join"""
+        if agent_id is None:
+            return None, None
+        cached = self._agent_contacts.get(agent_id)
+        if cached and cached[0] > datetime.now():
+            return cached[1], cached[2]
+        
+        row = conn.execute(text("""
+            SELECT first_name, last_name, email FROM users WHERE id = :agent_id
+        """), {'agent_id': agent_id}).fetchone()
+        if not row:
+            # Don't cache misses; the agent may be created later
+            return None, None
+        
+        if len(self._agent_contacts) >= self.max_cache_size:
+            self._agent_contacts.pop(next(iter(self._agent_contacts)))
+        agent_name = f"{row.first_name} {row.last_name}"
+        self._agent_contacts[agent_id] = (datetime.now() + self.cache_duration, agent_name, row.email)
+        return agent_name, row.email
     
     async def fetch_entity_context(self, entity_type: str, entity_id: str) -> Dict[str, Any]:
         """
@@ -126,39 +148,34 @@ class ContextManagementService:
             with get_db_connection() as conn:
                 # Try to find property by ID first
                 result = conn.execute(text("""
-                    SELECT p.*, 
-                           u.name as agent_name,
-                           u.email as agent_email
-                    FROM properties p
-                    LEFT JOIN users u ON p.agent_id = u.id
-                    WHERE p.id = :property_id
+                    SELECT p.* FROM properties p WHERE p.id = :property_id
                 """), {'property_id': property_id})
                 
                 property_data = result.fetchone()
                 
                 if not property_data:
-                    # Try to find by address or description
+                    # Try to find by address or description via the full-text index
                     result = conn.execute(text("""
-                        SELECT p.*, 
-                               u.name as agent_name,
-                               u.email as agent_email
-                        FROM properties p
-                        LEFT JOIN users u ON p.agent_id = u.id
-                        WHERE p.address ILIKE :search_term 
-                           OR p.description ILIKE :search_term
+                        SELECT p.* FROM properties p
+                        WHERE p.search_vector @@ plainto_tsquery('english', :search_term)
                         LIMIT 1
-                    """), {'search_term': f'%{property_id}%'})
+                    """), {'search_term': property_id})
                     
                     property_data = result.fetchone()
                 
                 if property_data:
+                    property_details = dict(property_data._mapping)
+                    property_details['agent_name'], property_details['agent_email'] = self._get_agent_contact(
+                        conn, property_details.get('agent_id')
+                    )
+                    
                     # Get market data for the area
-                    market_data = await self._get_market_data_for_area(property_data['address'])
+                    market_data = await self._get_market_data_for_area(property_data.address)
                     
                     return {
-                        'property': dict(property_data),
+                        'property': property_details,
                         'market_data': market_data,
-                        'similar_properties': await self._get_similar_properties(property_data),
+                        'similar_properties': await self._get_similar_properties(property_details),
                         'context_type': 'property_details',
                         'last_updated': datetime.now().isoformat()
                     }
@@ -320,7 +337,7 @@ class ContextManagementService:
                     'target_price': float(property_data['price'])
                 })
                 
-                return [dict(row) for row in result.fetchall()]
+                return [dict(row._mapping) for row in result.fetchall()]
                 
         except Exception as e:
             logger.error(f"Error getting similar properties: {e}")
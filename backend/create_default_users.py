@@ -3,19 +3,32 @@
 Simple script to create default users for the Dubai Real Estate RAG System
 """
 
-import bcrypt
+import sys
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import logging
 
+from utils.seed_passwords import hash_seed_password
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def hash_password(password: str) -> str:
-    """Hash password using bcrypt"""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+USER_SUMMARY_BANNER = (
+    "\n" + "="*60 + "\n"
+    "👥 DEFAULT USERS CREATED!\n"
+    + "="*60 + "\n"
+    "📧 Email Addresses:\n"
+    "   - admin1@dubai-estate.com (Admin)\n"
+    "   - admin2@dubai-estate.com (Admin)\n"
+    "   - agent1@dubai-estate.com (Agent)\n"
+    "   - agent2@dubai-estate.com (Agent)\n"
+    "\n🔑 Default Passwords:\n"
+    "   - Admins: Admin123!\n"
+    "   - Agents: Agent123!\n"
+    "\n💡 Professional access only - login required!\n"
+    + "="*60 + "\n"
+)
 
 def create_default_users():
     """Create default admin and agent users"""
@@ -50,12 +63,16 @@ def create_default_users():
             )
         """)
         
+        # Users sharing a demo password share one hash instead of re-running bcrypt
+        admin_password_hash = hash_seed_password("Admin123!")
+        agent_password_hash = hash_seed_password("Agent123!")
+        
         # Default users data
         default_users = [
             # Admin users
             {
                 "email": "admin1@dubai-estate.com",
-                "password_hash": hash_password("Admin123!"),
+                "password_hash": admin_password_hash,
                 "first_name": "Ahmed",
                 "last_name": "Al Mansouri",
                 "role": "admin",
@@ -64,7 +81,7 @@ def create_default_users():
             },
             {
                 "email": "admin2@dubai-estate.com",
-                "password_hash": hash_password("Admin123!"),
+                "password_hash": admin_password_hash,
                 "first_name": "Fatima",
                 "last_name": "Al Zahra",
                 "role": "admin",
@@ -74,7 +91,7 @@ def create_default_users():
             # Agent users
             {
                 "email": "agent1@dubai-estate.com",
-                "password_hash": hash_password("Agent123!"),
+                "password_hash": agent_password_hash,
                 "first_name": "Mohammed",
                 "last_name": "Al Rashid",
                 "role": "agent",
@@ -83,7 +100,7 @@ def create_default_users():
             },
             {
                 "email": "agent2@dubai-estate.com",
-                "password_hash": hash_password("Agent123!"),
+                "password_hash": agent_password_hash,
                 "first_name": "Aisha",
                 "last_name": "Al Qasimi",
                 "role": "agent",
@@ -92,44 +109,41 @@ def create_default_users():
             }
         ]
         
+        # Check which users already exist with a single query
+        cursor.execute(
+            "SELECT email FROM users WHERE email = ANY(%s)",
+            ([user["email"] for user in default_users],)
+        )
+        existing_emails = {row[0] for row in cursor.fetchall()}
+        
         # Insert default users
+        new_users = []
         for user in default_users:
-            # Check if user already exists
-            cursor.execute("SELECT id FROM users WHERE email = %s", (user["email"],))
-            if not cursor.fetchone():
-                cursor.execute("""
-                    INSERT INTO users (email, password_hash, first_name, last_name, role, is_active, email_verified)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    user["email"],
-                    user["password_hash"],
-                    user["first_name"],
-                    user["last_name"],
-                    user["role"],
-                    user["is_active"],
-                    user["email_verified"]
-                ))
-                logger.info(f"✅ Created user: {user['email']} ({user['role']})")
-            else:
+            if user["email"] in existing_emails:
                 logger.info(f"ℹ️ User already exists: {user['email']}")
+                continue
+            new_users.append((
+                user["email"],
+                user["password_hash"],
+                user["first_name"],
+                user["last_name"],
+                user["role"],
+                user["is_active"],
+                user["email_verified"]
+            ))
+            logger.info(f"✅ Created user: {user['email']} ({user['role']})")
+        
+        if new_users:
+            cursor.executemany("""
+                INSERT INTO users (email, password_hash, first_name, last_name, role, is_active, email_verified)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """, new_users)
         
         conn.commit()
         logger.info("✅ Default users created successfully")
         
         # Display user summary
-        print("\n" + "="*60)
-        print("👥 DEFAULT USERS CREATED!")
-        print("="*60)
-        print("📧 Email Addresses:")
-        print("   - admin1@dubai-estate.com (Admin)")
-        print("   - admin2@dubai-estate.com (Admin)")
-        print("   - agent1@dubai-estate.com (Agent)")
-        print("   - agent2@dubai-estate.com (Agent)")
-        print("\n🔑 Default Passwords:")
-        print("   - Admins: Admin123!")
-        print("   - Agents: Agent123!")
-        print("\n💡 Professional access only - login required!")
-        print("="*60)
+        sys.stdout.write(USER_SUMMARY_BANNER)
         
     except Exception as e:
         logger.error(f"❌ Error creating default users: {e}")
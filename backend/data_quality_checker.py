@@ -13,6 +13,9 @@ from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import instead of being looked up per row
+_PHONE_SEPARATORS = re.compile(r'[\s\-\(\)]')
+
 class DataQualityChecker:
     """Comprehensive data quality checker for real estate data"""
     
@@ -38,6 +41,8 @@ class DataQualityChecker:
                 'jumeirah', 'al barsha', 'al quoz', 'al wasl', 'al safa', 'umm suqeim'
             ]
         }
+        self._email_re = re.compile(self.validation_patterns['email'])
+        self._phone_uae_re = re.compile(self.validation_patterns['phone_uae'])
         
         # Data quality thresholds
         self.quality_thresholds = {
@@ -204,7 +209,7 @@ class DataQualityChecker:
         for email in email_series:
             if pd.notna(email) and str(email).strip():
                 total_emails += 1
-                if re.match(self.validation_patterns['email'], str(email)):
+                if self._email_re.match(str(email)):
                     valid_emails += 1
         
         return valid_emails / total_emails if total_emails > 0 else 1.0
@@ -220,8 +225,8 @@ class DataQualityChecker:
         for phone in phone_series:
             if pd.notna(phone) and str(phone).strip():
                 total_phones += 1
-                phone_str = re.sub(r'[\s\-\(\)]', '', str(phone))
-                if re.match(self.validation_patterns['phone_uae'], phone_str):
+                phone_str = _PHONE_SEPARATORS.sub('', str(phone))
+                if self._phone_uae_re.match(phone_str):
                     valid_phones += 1
         
         return valid_phones / total_phones if total_phones > 0 else 1.0
@@ -7,13 +7,8 @@ This script demonstrates the new conversational CRM capabilities
 implemented in Phase 3.
 """
 
-import sys
-import os
 from datetime import datetime
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 def print_demo_header():
     """Print demo header"""
     print("🎯 Phase 3 Demo: Conversational CRM & Workflow Automation")
@@ -12,13 +12,13 @@ from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
-import shutil
+import asyncio
 import os
 import pandas as pd
 
 # Import dependencies
 from config.settings import UPLOAD_DIR, MAX_FILE_SIZE, ALLOWED_EXTENSIONS
-from werkzeug.utils import secure_filename
+from utils.file_security import safe_upload_filename, save_upload_file
 
 # Import processing services
 from intelligent_processor import IntelligentDataProcessor
@@ -116,8 +116,7 @@ def generate_enhanced_analysis(file: UploadFile, file_type: str) -> Dict[str, An
     # Save file temporarily to extract content
     temp_file_path = UPLOAD_DIR / f"temp_{file.filename}"
     try:
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        save_upload_file(file, temp_file_path)
         
         # Extract content for classification
         content = intelligent_processor.extract_content(str(temp_file_path), file_type)
@@ -175,17 +174,14 @@ async def upload_file(file: UploadFile = File(...)):
             raise HTTPException(status_code=400, detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024)}MB")
         
         # Create safe filename
-        safe_filename = secure_filename(file.filename)
-        if not safe_filename:
-            safe_filename = f"upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.bin"
+        safe_filename = safe_upload_filename(file.filename)
         
         # Ensure upload directory exists
         UPLOAD_DIR.mkdir(exist_ok=True)
         
         # Save file
         file_path = UPLOAD_DIR / safe_filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, file_path)
         
         return FileUploadResponse(
             status='success',
@@ -212,8 +208,7 @@ async def analyze_file(file: UploadFile = File(...)):
     file_path = temp_dir / file.filename
     
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, file_path)
 
         # Get the file type (e.g., 'pdf', 'csv')
         file_type = file.filename.split('.')[-1].lower()
@@ -247,8 +242,7 @@ async def process_transaction_data(file: UploadFile = File(...)):
         
         # Save file temporarily
         temp_file_path = UPLOAD_DIR / f"temp_{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, temp_file_path)
         
         # Determine file type
         file_type = 'csv' if file.filename.lower().endswith('.csv') else 'excel'
@@ -309,8 +303,7 @@ async def check_data_quality(file: UploadFile = File(...), data_type: str = Form
         
         # Save file temporarily
         temp_file_path = UPLOAD_DIR / f"temp_{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, temp_file_path)
         
         # Determine file type
         file_type = 'csv' if file.filename.lower().endswith('.csv') else 'excel'
@@ -353,8 +346,7 @@ async def fix_data_issues(file: UploadFile = File(...), data_type: str = Form("t
         
         # Save file temporarily
         temp_file_path = UPLOAD_DIR / f"temp_{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, temp_file_path)
         
         # Determine file type
         file_type = 'csv' if file.filename.lower().endswith('.csv') else 'excel'
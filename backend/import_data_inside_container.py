@@ -9,12 +9,25 @@ import psycopg2
 from sqlalchemy import create_engine, text
 import logging
 from datetime import datetime
+import csv
+import io
 import os
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _copy_insert(table, conn, keys, data_iter):
+    """pandas to_sql method that streams rows through COPY FROM STDIN instead of INSERT"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+    
+    columns = ", ".join(f'"{key}"' for key in keys)
+    table_name = f"{table.schema}.{table.name}" if table.schema else table.name
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
+
 class ContainerDataImporter:
     def __init__(self):
         # Use the internal Docker network URL
@@ -52,7 +65,10 @@ class ContainerDataImporter:
                     pool_access BOOLEAN,
                     security BOOLEAN,
                     description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    search_vector tsvector GENERATED ALWAYS AS (
+                        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(location, '') || ' ' || coalesce(description, ''))
+                    ) STORED
                 )
                 """
                 
@@ -65,6 +81,17 @@ class ContainerDataImporter:
             logger.error(f"Error creating properties table: {e}")
             return False
     
+    def create_properties_indexes(self):
+        """Create indexes for the hot property lookups"""
+        with self.engine.connect() as conn:
+            # Chat context lookups read the cheapest listings within a budget range
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_properties_price_aed ON properties(price_aed)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_properties_type_price_aed ON properties(property_type, price_aed)"))
+            # Free-text property lookups match against this instead of ILIKE '%term%' on each column
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_properties_search_vector ON properties USING gin (search_vector)"))
+            conn.commit()
+        logger.info("✅ Properties indexes created")
+    
     def import_property_data(self):
         """Import property_listings.csv into the database"""
         try:
@@ -93,12 +120,11 @@ class ContainerDataImporter:
             # Recreate the table
             self.create_properties_table()
             
-            # Import new data in batches to avoid parameter limit
-            batch_size = 100
-            for i in range(0, len(df), batch_size):
-                batch = df.iloc[i:i+batch_size]
-                logger.info(f"Importing batch {i//batch_size + 1}/{(len(df) + batch_size - 1)//batch_size}")
-                batch.to_sql('properties', self.engine, if_exists='append', index=False, method='multi')
+            # Stream all rows in one COPY; no bind parameters, so no batching needed
+            df.to_sql('properties', self.engine, if_exists='append', index=False, method=_copy_insert)
+            
+            # Build secondary indexes after the load rather than maintaining them row by row
+            self.create_properties_indexes()
             
             logger.info(f"✅ Successfully imported {len(df)} properties to database")
             return True
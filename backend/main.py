@@ -32,10 +32,10 @@ import uuid
 from datetime import datetime
 import json
 import pandas as pd
-import shutil
+import asyncio
 import time
 from pathlib import Path
-from werkzeug.utils import secure_filename
+from utils.file_security import safe_upload_filename, save_upload_file
 
 # Import property management router
 from property_management import router as property_router
@@ -334,27 +334,37 @@ class FileUploadResponse(BaseModel):
     file_type: str
     file_size: int
 
+# Liveness probes hit /health about once a second; rebuild its body at most that often
+HEALTH_CACHE_TTL = 1.0  # seconds
+_health_cache = {"expires_at": 0.0, "body": None}
+
+ROOT_RESPONSE = {
+    "message": "Dubai Real Estate RAG Chat System API",
+    "version": "1.2.0",
+    "status": "running",
+    "docs": "/docs"
+}
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "2.0.0",
-        "blueprint_2_enabled": True
-    }
+    now = time.monotonic()
+    if now >= _health_cache["expires_at"]:
+        _health_cache["body"] = {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "version": "2.0.0",
+            "blueprint_2_enabled": True
+        }
+        _health_cache["expires_at"] = now + HEALTH_CACHE_TTL
+    return _health_cache["body"]
 
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Dubai Real Estate RAG Chat System API",
-        "version": "1.2.0",
-        "status": "running",
-        "docs": "/docs"
-    }
+    return ROOT_RESPONSE
 
 # Chat endpoint moved to chat_sessions_router.py
 
@@ -377,11 +387,10 @@ async def upload_file(
             raise HTTPException(status_code=400, detail="File too large")
         
         # Save file
-        filename = secure_filename(file.filename)
+        filename = safe_upload_filename(file.filename)
         file_path = UPLOAD_DIR / filename
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(save_upload_file, file, file_path)
         
         # Parse tags
         tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else []
@@ -539,50 +548,53 @@ async def get_user_agenda(current_user = Depends(get_current_user)):
         from datetime import datetime
         
         with engine.connect() as conn:
-            # Get scheduled follow-ups for today
-            follow_ups_result = conn.execute(text("""
-                SELECT l.id, l.name, l.email, l.next_follow_up_at, l.nurture_status
-                FROM leads l
-                WHERE l.agent_id = :agent_id
-                AND l.next_follow_up_at::date = CURRENT_DATE
-                AND l.status NOT IN ('closed', 'lost')
-                ORDER BY l.next_follow_up_at ASC
+            # Get today's follow-ups and leads needing attention in one round trip; the
+            # follow-up date is a range so idx_leads_next_follow_up can serve it
+            leads_result = conn.execute(text("""
+                (SELECT 'scheduled_follow_up' AS kind, l.id, l.name, l.email,
+                        l.next_follow_up_at AS activity_at, l.nurture_status
+                 FROM leads l
+                 WHERE l.agent_id = :agent_id
+                 AND l.next_follow_up_at >= CURRENT_DATE
+                 AND l.next_follow_up_at < CURRENT_DATE + 1
+                 AND l.status NOT IN ('closed', 'lost')
+                 ORDER BY l.next_follow_up_at ASC)
+                UNION ALL
+                (SELECT 'needs_attention' AS kind, l.id, l.name, l.email,
+                        l.last_contacted_at AS activity_at, l.nurture_status
+                 FROM leads l
+                 WHERE l.agent_id = :agent_id
+                 AND (l.last_contacted_at IS NULL OR 
+                      l.last_contacted_at < NOW() - INTERVAL '5 days')
+                 AND l.status NOT IN ('closed', 'lost')
+                 AND l.nurture_status != 'Closed'
+                 ORDER BY l.last_contacted_at ASC NULLS FIRST
+                 LIMIT 5)
+                ORDER BY kind DESC, activity_at ASC NULLS FIRST
             """), {'agent_id': current_user.id})
             
             follow_ups = []
-            for row in follow_ups_result.fetchall():
-                follow_ups.append({
-                    "lead_id": row.id,
-                    "lead_name": row.name,
-                    "lead_email": row.email,
-                    "scheduled_time": row.next_follow_up_at.isoformat() if row.next_follow_up_at else None,
-                    "nurture_status": row.nurture_status,
-                    "type": "scheduled_follow_up"
-                })
-            
-            # Get leads needing attention
-            attention_result = conn.execute(text("""
-                SELECT l.id, l.name, l.email, l.last_contacted_at, l.nurture_status
-                FROM leads l
-                WHERE l.agent_id = :agent_id
-                AND (l.last_contacted_at IS NULL OR 
-                     l.last_contacted_at < NOW() - INTERVAL '5 days')
-                AND l.status NOT IN ('closed', 'lost')
-                AND l.nurture_status != 'Closed'
-                ORDER BY l.last_contacted_at ASC NULLS FIRST
-                LIMIT 5
-            """), {'agent_id': current_user.id})
-            
             attention_needed = []
-            for row in attention_result.fetchall():
-                attention_needed.append({
-                    "lead_id": row.id,
-                    "lead_name": row.name,
-                    "lead_email": row.email,
-                    "last_contacted": row.last_contacted_at.isoformat() if row.last_contacted_at else None,
-                    "nurture_status": row.nurture_status,
-                    "type": "needs_attention"
-                })
+            for row in leads_result.fetchall():
+                activity_at = row.activity_at.isoformat() if row.activity_at else None
+                if row.kind == "scheduled_follow_up":
+                    follow_ups.append({
+                        "lead_id": row.id,
+                        "lead_name": row.name,
+                        "lead_email": row.email,
+                        "scheduled_time": activity_at,
+                        "nurture_status": row.nurture_status,
+                        "type": "scheduled_follow_up"
+                    })
+                else:
+                    attention_needed.append({
+                        "lead_id": row.id,
+                        "lead_name": row.name,
+                        "lead_email": row.email,
+                        "last_contacted": activity_at,
+                        "nurture_status": row.nurture_status,
+                        "type": "needs_attention"
+                    })
             
             # Get unread notifications
             notifications_result = conn.execute(text("""
@@ -27,6 +27,8 @@ class AutomatedReportingService:
     def __init__(self):
         self.report_templates = self._load_report_templates()
         self.report_history = []
+        # id -> report index so lookups don't scan the whole history
+        self._reports_by_id: Dict[str, Dict[str, Any]] = {}
         
     def _load_report_templates(self) -> Dict[str, Any]:
         """Load report templates for different report types"""
@@ -365,6 +367,7 @@ class AutomatedReportingService:
             
             # Store in memory for now (would be database in production)
             self.report_history.append(report_data)
+            self._reports_by_id.setdefault(report_id, report_data)
             
             logger.info(f"Report stored with ID: {report_id}")
             return report_id
@@ -530,10 +533,7 @@ class AutomatedReportingService:
     async def get_report_by_id(self, report_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific report by ID"""
         try:
-            for report in self.report_history:
-                if report['id'] == report_id:
-                    return report
-            return None
+            return self._reports_by_id.get(report_id)
         except Exception as e:
             logger.error(f"Error getting report by ID: {e}")
             return None
@@ -541,12 +541,18 @@ class AutomatedReportingService:
     async def delete_report(self, report_id: str) -> bool:
         """Delete a report by ID"""
         try:
-            for i, report in enumerate(self.report_history):
-                if report['id'] == report_id:
-                    del self.report_history[i]
-                    logger.info(f"Report {report_id} deleted successfully")
-                    return True
-            return False
+            report = self._reports_by_id.pop(report_id, None)
+            if report is None:
+                return False
+            
+            self.report_history = [r for r in self.report_history if r is not report]
+            # Re-point the index at any remaining report generated with the same ID
+            duplicate = next((r for r in self.report_history if r['id'] == report_id), None)
+            if duplicate is not None:
+                self._reports_by_id[report_id] = duplicate
+            
+            logger.info(f"Report {report_id} deleted successfully")
+            return True
         except Exception as e:
             logger.error(f"Error deleting report: {e}")
             return False
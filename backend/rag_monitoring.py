@@ -4,6 +4,7 @@ Provides comprehensive AI & RAG system monitoring metrics
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Union, Any, Optional
 from dataclasses import dataclass, asdict
@@ -24,6 +25,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/admin", tags=["RAG Monitoring"])
 metrics_collector = MetricsCollector()
 
+# The admin dashboard polls /rag-metrics; serve the aggregated snapshot for a few
+# seconds instead of re-running every metric query on each hit
+RAG_METRICS_CACHE_TTL = 15  # seconds
+_rag_metrics_cache: Dict[str, Any] = {"expires_at": 0.0, "payload": None}
+_rag_metrics_lock = asyncio.Lock()
+
 @dataclass
 class QuerySuccessMetrics:
     """Query success rate metrics"""
@@ -91,47 +98,35 @@ class RAGMonitoringService:
     async def get_query_success_metrics(self) -> QuerySuccessMetrics:
         """Get query success rate metrics"""
         try:
-            # Query success rates from database
+            # Overall and per-category success counts in one pass; ROLLUP adds the grand-total
+            # row, flagged by GROUPING() so it isn't confused with a NULL category
             query = text("""
-                SELECT 
-                    COUNT(*) as total_queries,
-                    COUNT(CASE WHEN status = 'success' THEN 1 END) as successful_queries,
-                    COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_queries
-                FROM rag_queries 
-                WHERE created_at >= :start_date
-            """)
-            
-            result = await self.db.execute(query, {
-                'start_date': datetime.now() - timedelta(days=30)
-            })
-            row = result.fetchone()
-            
-            total_queries = row.total_queries or 0
-            successful_queries = row.successful_queries or 0
-            failed_queries = row.failed_queries or 0
-            
-            overall_success_rate = (successful_queries / total_queries * 100) if total_queries > 0 else 0
-            
-            # Get success rates by category
-            category_query = text("""
                 SELECT 
                     category,
+                    GROUPING(category) as is_total,
                     COUNT(*) as total,
-                    COUNT(CASE WHEN status = 'success' THEN 1 END) as successful
+                    COUNT(*) FILTER (WHERE status = 'success') as successful,
+                    COUNT(*) FILTER (WHERE status = 'failed') as failed
                 FROM rag_queries 
                 WHERE created_at >= :start_date
-                GROUP BY category
+                GROUP BY ROLLUP (category)
             """)
             
-            category_result = await self.db.execute(category_query, {
+            result = await self.db.execute(query, {
                 'start_date': datetime.now() - timedelta(days=30)
             })
             
+            total_queries = successful_queries = failed_queries = 0
             success_by_category = {}
-            for cat_row in category_result:
-                if cat_row.total > 0:
-                    success_rate = (cat_row.successful / cat_row.total) * 100
-                    success_by_category[cat_row.category] = success_rate
+            for row in result:
+                if row.is_total:
+                    total_queries = row.total or 0
+                    successful_queries = row.successful or 0
+                    failed_queries = row.failed or 0
+                elif row.total > 0:
+                    success_by_category[row.category] = (row.successful / row.total) * 100
+            
+            overall_success_rate = (successful_queries / total_queries * 100) if total_queries > 0 else 0
             
             return QuerySuccessMetrics(
                 overall_success_rate=overall_success_rate,
@@ -310,12 +305,19 @@ class RAGMonitoringService:
     async def get_model_performance_metrics(self) -> ModelPerformanceMetrics:
         """Get model performance metrics"""
         try:
-            # Get API usage metrics from Redis
-            api_calls = await self.redis.get("model:api_calls_today") or 12450
-            avg_cost = await self.redis.get("model:avg_cost_per_call") or 0.0023
-            total_cost = await self.redis.get("model:total_cost_today") or 28.64
-            rate_limit = await self.redis.get("model:rate_limit_usage") or 45
-            errors = await self.redis.get("model:errors_today") or 12
+            # Get API usage metrics from Redis in a single MGET round trip
+            api_calls, avg_cost, total_cost, rate_limit, errors = await self.redis.mget(
+                "model:api_calls_today",
+                "model:avg_cost_per_call",
+                "model:total_cost_today",
+                "model:rate_limit_usage",
+                "model:errors_today",
+            )
+            api_calls = api_calls or 12450
+            avg_cost = avg_cost or 0.0023
+            total_cost = total_cost or 28.64
+            rate_limit = rate_limit or 45
+            errors = errors or 12
             
             # Get performance alerts
             alerts = [
@@ -434,44 +436,57 @@ async def get_rag_metrics(
 ) -> Dict[str, Any]:
     """Get comprehensive RAG monitoring metrics"""
     try:
-        # Fetch all RAG metrics concurrently
-        tasks = [
-            service.get_query_success_metrics(),
-            service.get_response_time_metrics(),
-            service.get_context_retrieval_metrics(),
-            service.get_user_satisfaction_metrics(),
-            service.get_model_performance_metrics(),
-            service.get_training_insights_metrics()
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        metrics = {}
-        metric_names = [
-            'query_success', 'response_time', 'context_retrieval',
-            'user_satisfaction', 'model_performance', 'training_insights'
-        ]
-        
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error fetching {metric_names[i]}: {result}")
-                metrics[metric_names[i]] = {}
-            else:
-                metrics[metric_names[i]] = asdict(result) if hasattr(result, '__dataclass_fields__') else result
+        payload = _rag_metrics_cache["payload"]
+        if payload is None or time.monotonic() >= _rag_metrics_cache["expires_at"]:
+            async with _rag_metrics_lock:
+                # Another request may have refreshed the snapshot while we waited
+                payload = _rag_metrics_cache["payload"]
+                if payload is None or time.monotonic() >= _rag_metrics_cache["expires_at"]:
+                    payload = await _collect_rag_metrics(service)
+                    _rag_metrics_cache["payload"] = payload
+                    _rag_metrics_cache["expires_at"] = time.monotonic() + RAG_METRICS_CACHE_TTL
         
         # Track RAG monitoring access
         await metrics_collector.track_rag_monitoring_access()
         
-        return {
-            "status": "success",
-            "timestamp": datetime.now().isoformat(),
-            "metrics": metrics
-        }
+        return payload
         
     except Exception as e:
         logger.error(f"Error in RAG metrics endpoint: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch RAG metrics")
 
+async def _collect_rag_metrics(service: RAGMonitoringService) -> Dict[str, Any]:
+    # Fetch all RAG metrics concurrently
+    tasks = [
+        service.get_query_success_metrics(),
+        service.get_response_time_metrics(),
+        service.get_context_retrieval_metrics(),
+        service.get_user_satisfaction_metrics(),
+        service.get_model_performance_metrics(),
+        service.get_training_insights_metrics()
+    ]
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    metrics = {}
+    metric_names = [
+        'query_success', 'response_time', 'context_retrieval',
+        'user_satisfaction', 'model_performance', 'training_insights'
+    ]
+    
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(f"Error fetching {metric_names[i]}: {result}")
+            metrics[metric_names[i]] = {}
+        else:
+            metrics[metric_names[i]] = asdict(result) if hasattr(result, '__dataclass_fields__') else result
+    
+    return {
+        "status": "success",
+        "timestamp": datetime.now().isoformat(),
+        "metrics": metrics
+    }
+
 @router.get("/rag-performance-trends")
 async def get_rag_performance_trends(
     timeframe: str = Query("24h", description="Timeframe: 1h, 24h, 7d, 30d"),
@@ -6,7 +6,13 @@ Addresses core issues: conversational tone, data presentation, information archi
 
 import os
 import re
+import asyncio
 import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Tuple
 import chromadb
 from sqlalchemy import create_engine, text
@@ -45,10 +51,15 @@ class QueryIntent(Enum):
     SCHEDULE_FOLLOW_UP = "schedule_follow_up"
     GENERAL = "general"
 
-def get_system_prompt(user_role: str, intent: QueryIntent, retrieved_context: str, user_name: str = "User"):
+def get_system_prompt(user_role: str, intent: QueryIntent, retrieved_context: str, user_name: str = "User",
+                      user_query: Optional[str] = None):
     """
     Generates a dynamic system prompt based on user role, intent, and retrieved context.
+    When user_query is given, the query and response sections are appended in the same
+    pass so the (context-sized) prompt is only built once.
     """
+    role_key, role_label = _resolve_role(user_role)
+    query_section = "" if user_query is None else f"\n\n## USER QUERY:\n{user_query}\n\n## RESPONSE:\n"
 
     # Base Persona and Core Directives
     system_prompt = f"""
@@ -73,7 +84,7 @@ You are "Dubai Realty AI," an expert-level real estate intelligence assistant fo
 ---
 
 ## USER and INTENT ANALYSIS:
--   **User Role**: {user_role.upper()}
+-   **User Role**: {role_label}
 -   **Query Intent**: {intent.name}
 
 ---
@@ -98,7 +109,7 @@ This information has been sourced directly from our internal databases (PostgreS
 
 ### **3. Detailed Analysis & Market Context**
 (Elaborate on the key insights. Explain the "why" behind the data, referencing current market conditions, trends, or regulatory factors mentioned in the context. This section should be tailored to the user's role.)
-{get_role_specific_guidance(user_role, intent)}
+{get_role_specific_guidance(role_key, intent)}
 
 ### **4. Actionable Recommendations**
 (Provide specific, actionable steps the user should consider next. These should be logical conclusions derived *only* from the provided context.)
@@ -144,26 +155,139 @@ If the user is searching for specific properties (QueryIntent.PROPERTY_SEARCH),
 - **Highlight Opportunities**: Point out unique advantages or opportunities
 - **Address Concerns**: Proactively address potential concerns or risks
 - **Use Visual Elements**: Employ emojis, bold text, and structured formatting for clarity
-"""
+{query_section}"""
     return system_prompt
 
-def get_role_specific_guidance(user_role: str, intent: QueryIntent):
-    """
-    Provides role- and intent-specific instructions for the Detailed Analysis section.
+class _RoleTextMap(dict):
+    """Role -> prompt text lookup; unknown roles resolve to an empty string.
+
+    Exposed read-only through MappingProxyType, which still defers to __missing__.
     """
-    if user_role == "client":
-        return """
+    __slots__ = ()
+
+    def __missing__(self, role):
+        return ""
+
+@lru_cache(maxsize=64)
+def _resolve_role(user_role: str) -> Tuple[str, str]:
+    """(lookup key, display label) for a role string, normalized once per distinct value"""
+    key = (user_role or "client").strip().lower()
+    return key, key.upper()
+
+ROLE_GUIDANCE = MappingProxyType(_RoleTextMap({
+    "client": """
         - **For the Client**: Focus on what the data means for their property search or investment. Explain pricing, compare neighborhood amenities, and clarify investment benefits like the Golden Visa or rental yields. If discussing properties, mention developers and unique features.
-        """
-    elif user_role == "agent":
-        return """
+        """,
+    "agent": """
         - **For the Agent**: Frame the analysis to provide a competitive edge. Highlight market trends, compare pricing with competing areas, and identify key selling points. Provide data that helps in client negotiations, property valuation, or lead generation strategies.
-        """
-    elif user_role == "admin":
-        return """
+        """,
+    "admin": """
         - **For the Admin**: Analyze the data from a business intelligence perspective. Summarize system performance, data quality, or user engagement metrics. Highlight trends that could inform business strategy or system improvements.
-        """
-    return ""
+        """,
+}))
+
+ROLE_PROMPT_CONTEXT = MappingProxyType(_RoleTextMap({
+    "client": """
+CLIENT ROLE CONTEXT:
+- Focus on property search, market information, and investment opportunities
+- Provide pricing guidance and area recommendations
+- Include financing options and payment plans
+- Mention Golden Visa benefits and residency requirements
+""",
+    "agent": """
+AGENT ROLE CONTEXT:
+- Provide market analysis and competitive insights
+- Include lead generation and client management tips
+- Share sales strategies and negotiation techniques
+- Offer property valuation and listing optimization advice
+""",
+    "admin": """
+ADMIN ROLE CONTEXT:
+- Focus on system management and data analysis
+- Provide performance metrics and reporting insights
+- Include user management and security considerations
+- Offer business intelligence and market forecasting
+""",
+}))
+
+IMPROVED_PROMPT_SYSTEM = """
+You are an expert Dubai real estate AI assistant. Provide helpful, accurate responses based on available data.
+
+RESPONSE REQUIREMENTS:
+1. **Keep responses concise** - Answer directly without unnecessary elaboration
+2. **Use available data** - Only reference information from the provided context
+3. **Be honest about limitations** - If you don't have specific data, say so
+4. **Focus on user intent** - Match response length to query complexity
+5. **Avoid hallucination** - Don't make up specific prices, statistics, or data
+
+AVAILABLE CONTEXT:
+- Use only the information provided in the context below
+- If no relevant context is available, provide general guidance
+- Don't reference specific prices or statistics unless they're in the context
+
+USER ROLE: {role_label}
+
+RESPONSE GUIDELINES:
+- For simple greetings: Brief, friendly response
+- For property queries: Use available property data
+- For market questions: Provide general guidance if no specific data available
+- For complex queries: Structured but concise response
+"""
+
+# Extra instructions for the intents create_improved_prompt specializes
+INTENT_PROMPT_CONTEXT = MappingProxyType({
+    QueryIntent.PROPERTY_SEARCH: """
+PROPERTY SEARCH CONTEXT:
+- Provide specific property recommendations based on budget and preferences
+- Include current market prices and availability
+- Mention payment plans and financing options
+- Suggest similar properties and alternatives
+""",
+    QueryIntent.MARKET_INFO: """
+MARKET INFORMATION CONTEXT:
+- Provide current market statistics and trends
+- Include price movements and market forecasts
+- Mention investment opportunities and risks
+- Compare different areas and property types
+""",
+    QueryIntent.INVESTMENT_QUESTION: """
+INVESTMENT CONTEXT:
+- Focus on ROI and investment returns
+- Include rental yields and capital appreciation
+- Mention Golden Visa benefits and tax advantages
+- Provide investment strategy recommendations
+""",
+})
+
+@lru_cache(maxsize=64)
+def _improved_prompt_header(role_key: str) -> str:
+    """System instructions plus role context for create_improved_prompt, rendered once per role"""
+    system_prompt = IMPROVED_PROMPT_SYSTEM.format(role_label=role_key.upper())
+    return f"{system_prompt}\n\n{ROLE_PROMPT_CONTEXT[role_key]}"
+
+def get_role_specific_guidance(user_role: str, intent: QueryIntent):
+    """
+    Provides role- and intent-specific instructions for the Detailed Analysis section.
+    """
+    return ROLE_GUIDANCE[_resolve_role(user_role)[0]]
+
+GENERATION_CONFIG = MappingProxyType({
+    "temperature": 0.3,  # Lower temperature for more focused responses
+    "top_p": 0.9,
+    "top_k": 40,
+    "max_output_tokens": 2048,  # Allow longer, more detailed responses
+})
+
+GENERATION_ERROR_RESPONSE = "I apologize, but I encountered an error while processing your request. Please try again or contact support if the issue persists."
+
+@lru_cache(maxsize=1)
+def get_generation_model():
+    """Configure Gemini once per process and reuse the model client"""
+    import google.generativeai as genai
+    from config.settings import GOOGLE_API_KEY
+    
+    genai.configure(api_key=GOOGLE_API_KEY)
+    return genai.GenerativeModel('gemini-1.5-flash')
 
 @dataclass
 class QueryAnalysis:
@@ -183,6 +307,15 @@ class EnhancedRAGService:
     def __init__(self):
         self.engine = create_engine(os.getenv("DATABASE_URL"))
         
+        # LRU of generated responses keyed by (role, prompt hash); identical prompts
+        # (same role, query and retrieved context) skip the Gemini round-trip
+        self._response_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._response_cache_size = int(os.getenv("RAG_RESPONSE_CACHE_SIZE", "256"))
+        self._response_cache_lock = threading.Lock()
+        # In-flight async generations keyed like the cache, so concurrent identical
+        # prompts share a single Gemini call
+        self._inflight_responses: Dict[Tuple[str, str], "asyncio.Future[str]"] = {}
+        
         # Enhanced ChromaDB initialization with retry logic
         self.chroma_client = self._initialize_chroma_client()
         
@@ -334,6 +467,17 @@ class EnhancedRAGService:
                 r'\b(client|lead)\b.*\b(mentioned|said|expressed)\s+(.+)'
             ]
         }
+        
+        # Compile once; IGNORECASE lets analyze_query match the raw query without lowercasing it
+        self._compiled_intent_patterns = {
+            intent: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for intent, patterns in self.intent_patterns.items()
+        }
+        self._compiled_entity_patterns = {
+            entity_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for entity_type, patterns in self.entity_patterns.items()
+        }
+        self._max_intent_patterns = max(len(patterns) for patterns in self.intent_patterns.values())
     
     def _initialize_chroma_client(self, max_retries=5, retry_delay=2):
         """Initialize ChromaDB client with retry logic"""
@@ -357,36 +501,35 @@ class EnhancedRAGService:
 
     def analyze_query(self, query: str) -> QueryAnalysis:
         """Analyze user query to extract intent, entities, and parameters"""
-        query_lower = query.lower()
-        
         # Determine intent
         intent_scores = {}
-        for intent, patterns in self.intent_patterns.items():
+        for intent, patterns in self._compiled_intent_patterns.items():
             score = 0
             for pattern in patterns:
-                if re.search(pattern, query_lower, re.IGNORECASE):
+                if pattern.search(query):
                     score += 1
             intent_scores[intent] = score
         
         # Get the intent with highest score
         if intent_scores:
             intent = max(intent_scores, key=intent_scores.get)
-            confidence = intent_scores[intent] / max(len(patterns) for patterns in self.intent_patterns.values())
+            confidence = intent_scores[intent] / self._max_intent_patterns
         else:
             intent = QueryIntent.GENERAL
             confidence = 0.0
         
-        # Extract entities
+        # Extract entities (captured values are normalised to lowercase as before)
         entities = {}
-        for entity_type, patterns in self.entity_patterns.items():
+        for entity_type, patterns in self._compiled_entity_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, query_lower, re.IGNORECASE)
+                matches = pattern.findall(query)
                 if matches:
-                    entities[entity_type] = matches[0] if isinstance(matches[0], str) else matches[0][0]
+                    match = matches[0] if isinstance(matches[0], str) else matches[0][0]
+                    entities[entity_type] = match.lower()
                     break
         
         # Extract parameters
-        parameters = self._extract_parameters(query_lower, entities)
+        parameters = self._extract_parameters(query, entities)
         
         return QueryAnalysis(
             intent=intent,
@@ -800,91 +943,17 @@ class EnhancedRAGService:
 
     def create_improved_prompt(self, query: str, analysis: QueryAnalysis, context: str, user_role: str = "client") -> str:
         """Create an improved prompt with enhanced Dubai real estate context"""
+        role_key = _resolve_role(user_role)[0]
         
-        # Enhanced system prompt with specific Dubai real estate expertise
-        system_prompt = f"""
-You are an expert Dubai real estate AI assistant. Provide helpful, accurate responses based on available data.
-
-RESPONSE REQUIREMENTS:
-1. **Keep responses concise** - Answer directly without unnecessary elaboration
-2. **Use available data** - Only reference information from the provided context
-3. **Be honest about limitations** - If you don't have specific data, say so
-4. **Focus on user intent** - Match response length to query complexity
-5. **Avoid hallucination** - Don't make up specific prices, statistics, or data
-
-AVAILABLE CONTEXT:
-- Use only the information provided in the context below
-- If no relevant context is available, provide general guidance
-- Don't reference specific prices or statistics unless they're in the context
-
-USER ROLE: {user_role.upper()}
-
-RESPONSE GUIDELINES:
-- For simple greetings: Brief, friendly response
-- For property queries: Use available property data
-- For market questions: Provide general guidance if no specific data available
-- For complex queries: Structured but concise response
-"""
-
-        # Role-specific context
-        role_context = ""
-        if user_role == "client":
-            role_context = """
-CLIENT ROLE CONTEXT:
-- Focus on property search, market information, and investment opportunities
-- Provide pricing guidance and area recommendations
-- Include financing options and payment plans
-- Mention Golden Visa benefits and residency requirements
-"""
-        elif user_role == "agent":
-            role_context = """
-AGENT ROLE CONTEXT:
-- Provide market analysis and competitive insights
-- Include lead generation and client management tips
-- Share sales strategies and negotiation techniques
-- Offer property valuation and listing optimization advice
-"""
-        elif user_role == "admin":
-            role_context = """
-ADMIN ROLE CONTEXT:
-- Focus on system management and data analysis
-- Provide performance metrics and reporting insights
-- Include user management and security considerations
-- Offer business intelligence and market forecasting
-"""
+        # System instructions and role context only vary by role
+        prompt_header = _improved_prompt_header(role_key)
 
         # Intent-specific context
-        intent_context = ""
-        if analysis.intent == QueryIntent.PROPERTY_SEARCH:
-            intent_context = """
-PROPERTY SEARCH CONTEXT:
-- Provide specific property recommendations based on budget and preferences
-- Include current market prices and availability
-- Mention payment plans and financing options
-- Suggest similar properties and alternatives
-"""
-        elif analysis.intent == QueryIntent.MARKET_INFO:
-            intent_context = """
-MARKET INFORMATION CONTEXT:
-- Provide current market statistics and trends
-- Include price movements and market forecasts
-- Mention investment opportunities and risks
-- Compare different areas and property types
-"""
-        elif analysis.intent == QueryIntent.INVESTMENT_QUESTION:
-            intent_context = """
-INVESTMENT CONTEXT:
-- Focus on ROI and investment returns
-- Include rental yields and capital appreciation
-- Mention Golden Visa benefits and tax advantages
-- Provide investment strategy recommendations
-"""
+        intent_context = INTENT_PROMPT_CONTEXT.get(analysis.intent, "")
 
         # Build the complete prompt
-        prompt = f"""
-{system_prompt}
-
-{role_context}
+        return f"""
+{prompt_header}
 
 {intent_context}
 
@@ -902,8 +971,6 @@ QUERY ANALYSIS:
 IMPORTANT: Provide specific Dubai real estate information, actual prices, and actionable recommendations. Avoid generic responses.
 """
 
-        return prompt
-
     def _get_neighborhood_context(self, query: str, max_items: int) -> List[ContextItem]:
         """Get relevant neighborhood information from database"""
         context_items = []
@@ -1166,36 +1233,45 @@ IMPORTANT: Provide specific Dubai real estate information, actual prices, and ac
         """Get relevant properties from database based on parameters"""
         context_items = []
         
-        # Build SQL query based on parameters - use correct column names
-        sql_parts = ["SELECT id, title, description, price_aed as price, location, property_type, bedrooms, bathrooms, area_sqft FROM properties WHERE 1=1"]
-        query_params = {}
+        # Collect the filters and join them once; each condition binds its own parameter
+        conditions = []
+        query_params = {'limit': max_items}
         
         if not parameters:
-            sql_parts.append("AND price_aed > 0")
+            conditions.append("price_aed > 0")
         
         if 'budget_min' in parameters and 'budget_max' in parameters:
-            sql_parts.append("AND price_aed BETWEEN :budget_min AND :budget_max")
+            conditions.append("price_aed BETWEEN :budget_min AND :budget_max")
             query_params['budget_min'] = parameters['budget_min']
             query_params['budget_max'] = parameters['budget_max']
+        elif 'budget_max' in parameters:
+            conditions.append("price_aed <= :budget_max")
+            query_params['budget_max'] = parameters['budget_max']
         
         if 'location' in parameters:
-            sql_parts.append("AND location ILIKE :location")
+            conditions.append("location ILIKE :location")
+            query_params['location'] = f"%{parameters['location']}%"
         
         if 'property_type' in parameters:
-            sql_parts.append("AND property_type ILIKE :property_type")
+            conditions.append("property_type ILIKE :property_type")
+            query_params['property_type'] = f"%{parameters['property_type']}%"
         
         if 'bedrooms' in parameters:
-            sql_parts.append("AND bedrooms >= :bedrooms")
+            conditions.append("bedrooms >= :bedrooms")
+            query_params['bedrooms'] = parameters['bedrooms']
         
         if 'bathrooms' in parameters:
-            sql_parts.append("AND bathrooms >= :bathrooms")
+            conditions.append("bathrooms >= :bathrooms")
+            query_params['bathrooms'] = parameters['bathrooms']
         
-        sql_parts.append("ORDER BY price_aed ASC LIMIT :limit")
-        query_params['limit'] = max_items
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            "SELECT id, title, description, price_aed as price, location, property_type, bedrooms, bathrooms, area_sqft "
+            f"FROM properties{where_clause} ORDER BY price_aed ASC LIMIT :limit"
+        )
         
         try:
             with self.engine.connect() as conn:
-                sql = " ".join(sql_parts)
                 result = conn.execute(text(sql), query_params)
                 
                 for row in result:
@@ -1361,55 +1437,94 @@ IMPORTANT: Provide specific Dubai real estate information, actual prices, and ac
         
         return context_items
 
+    def _build_response_prompt(self, message: str, role: str, user_name: str) -> str:
+        """Analyze the query, retrieve context and build the full generation prompt"""
+        # 1. Analyze the query
+        analysis = self.analyze_query(message)
+        
+        # 2. Get relevant context with enhanced retrieval
+        context_items = self.get_relevant_context(message, analysis, max_items=8)
+        
+        # 3. Build enhanced context string
+        context = self.build_structured_context(context_items)
+        
+        # 4-5. Build the complete prompt (system prompt plus user query) in one pass
+        return get_system_prompt(role, analysis.intent, context, user_name, user_query=message)
+    
+    def _get_cached_response(self, cache_key: Tuple[str, str]) -> Optional[str]:
+        with self._response_cache_lock:
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                self._response_cache.move_to_end(cache_key)
+            return cached_response
+    
+    def _store_response(self, cache_key: Tuple[str, str], response_text: str) -> None:
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = response_text
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
     def get_response(self, message: str, role: str = "client", session_id: str = None, user_name: str = "User") -> str:
         """
         Main method to generate a response using the RAG service.
         This is the single source of truth for conversational AI responses.
         """
         try:
-            # 1. Analyze the query
-            analysis = self.analyze_query(message)
+            full_prompt = self._build_response_prompt(message, role, user_name)
             
-            # 2. Get relevant context with enhanced retrieval
-            context_items = self.get_relevant_context(message, analysis, max_items=8)
+            # 6. Serve identical prompts from the response cache
+            cache_key = (role, hashlib.sha256(full_prompt.encode("utf-8")).hexdigest())
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
             
-            # 3. Build enhanced context string
-            context = self.build_structured_context(context_items)
+            # 7. Generate response using AI model with enhanced parameters
+            response = get_generation_model().generate_content(
+                full_prompt,
+                generation_config=dict(GENERATION_CONFIG)
+            )
+            response_text = response.text.strip()
             
-            # 4. Create enhanced prompt using the improved system prompt
-            system_prompt = get_system_prompt(role, analysis.intent, context, user_name)
+            self._store_response(cache_key, response_text)
+            return response_text
             
-            # 5. Build the complete prompt
-            full_prompt = f"""
-{system_prompt}
-
-## USER QUERY:
-{message}
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return GENERATION_ERROR_RESPONSE
 
-## RESPONSE:
-"""
+    async def get_response_async(self, message: str, role: str = "client", session_id: str = None, user_name: str = "User") -> str:
+        """
+        Async variant of get_response for the chat endpoints. Retrieval runs in a worker
+        thread, generation uses Gemini's async client, and concurrent identical prompts
+        are coalesced onto one in-flight call.
+        """
+        try:
+            full_prompt = await asyncio.to_thread(self._build_response_prompt, message, role, user_name)
             
-            # 6. Generate response using AI model with enhanced parameters
-            import google.generativeai as genai
-            from config.settings import GOOGLE_API_KEY
+            cache_key = (role, hashlib.sha256(full_prompt.encode("utf-8")).hexdigest())
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
             
-            genai.configure(api_key=GOOGLE_API_KEY)
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            
-            # Enhanced generation parameters for better quality
-            response = model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Lower temperature for more focused responses
-                    top_p=0.9,
-                    top_k=40,
-                    max_output_tokens=2048,  # Allow longer, more detailed responses
-                )
-            )
-            response_text = response.text.strip()
+            pending = self._inflight_responses.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._generate_async(full_prompt))
+                self._inflight_responses[cache_key] = pending
+                pending.add_done_callback(lambda _: self._inflight_responses.pop(cache_key, None))
             
+            # Shield so one cancelled client does not cancel the call for the others
+            response_text = await asyncio.shield(pending)
+            self._store_response(cache_key, response_text)
             return response_text
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            return f"I apologize, but I encountered an error while processing your request. Please try again or contact support if the issue persists."
+            return GENERATION_ERROR_RESPONSE
+
+    async def _generate_async(self, full_prompt: str) -> str:
+        response = await get_generation_model().generate_content_async(
+            full_prompt,
+            generation_config=dict(GENERATION_CONFIG)
+        )
+        return response.text.strip()
@@ -13,18 +13,23 @@ Each report can be generated as a web page with a unique URL.
 
 import os
 import json
+import time
 import uuid
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 from sqlalchemy import create_engine, text
 import logging
+import redis
 
 from ai_manager import AIEnhancementManager
 from rag_service import EnhancedRAGService
-from config.settings import DATABASE_URL, GOOGLE_API_KEY
+from config.settings import DATABASE_URL, GOOGLE_API_KEY, REDIS_URL
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +39,90 @@ router = APIRouter(prefix="/reports", tags=["Report Generation"])
 ai_manager = AIEnhancementManager(DATABASE_URL, None)  # Will be initialized with model
 rag_service = EnhancedRAGService()
 
-# Store generated reports in memory (in production, use database)
-generated_reports = {}
+class RedisReportStore:
+    """
+    Generated reports kept in Redis so every worker sees them and they survive restarts.
+    Reports are JSON strings under report:{id}; a sorted set indexes ids by creation time.
+    If Redis is unreachable at startup, reports are kept in a bounded in-process dict instead.
+    The redis client is blocking, so each call runs in a worker thread off the event loop.
+    """
+    
+    KEY_PREFIX = "report:"
+    INDEX_KEY = "reports:index"
+    LOCAL_MAX_REPORTS = 500
+    
+    def __init__(self, redis_url: str, ttl_seconds: int = 7 * 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+        self.local_reports: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        try:
+            # One shared pool so concurrent requests reuse sockets
+            pool = redis.ConnectionPool.from_url(
+                redis_url, max_connections=64, decode_responses=True,
+                socket_connect_timeout=5, socket_timeout=5
+            )
+            self.client = redis.Redis(connection_pool=pool)
+            self.client.ping()
+        except Exception as e:
+            logger.warning(f"⚠️ Redis not available for reports, keeping them in memory: {e}")
+            self.client = None
+    
+    def _put(self, report_id: str, report_data: Dict[str, Any]):
+        pipe = self.client.pipeline()
+        pipe.set(self.KEY_PREFIX + report_id, json.dumps(report_data, default=str), ex=self.ttl_seconds)
+        pipe.zadd(self.INDEX_KEY, {report_id: time.time()})
+        pipe.execute()
+    
+    def _get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self.KEY_PREFIX + report_id)
+        return json.loads(raw) if raw else None
+    
+    def _delete(self, report_id: str) -> bool:
+        pipe = self.client.pipeline()
+        pipe.delete(self.KEY_PREFIX + report_id)
+        pipe.zrem(self.INDEX_KEY, report_id)
+        deleted, _ = pipe.execute()
+        return bool(deleted)
+    
+    def _items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        report_ids = self.client.zrange(self.INDEX_KEY, 0, -1)
+        if not report_ids:
+            return []
+        raw_reports = self.client.mget([self.KEY_PREFIX + report_id for report_id in report_ids])
+        
+        items, expired = [], []
+        for report_id, raw in zip(report_ids, raw_reports):
+            if raw:
+                items.append((report_id, json.loads(raw)))
+            else:
+                expired.append(report_id)
+        if expired:
+            self.client.zrem(self.INDEX_KEY, *expired)
+        return items
+    
+    async def put(self, report_id: str, report_data: Dict[str, Any]):
+        if self.client is None:
+            self.local_reports[report_id] = report_data
+            if len(self.local_reports) > self.LOCAL_MAX_REPORTS:
+                self.local_reports.popitem(last=False)
+            return
+        await asyncio.to_thread(self._put, report_id, report_data)
+    
+    async def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        if self.client is None:
+            return self.local_reports.get(report_id)
+        return await asyncio.to_thread(self._get, report_id)
+    
+    async def delete(self, report_id: str) -> bool:
+        if self.client is None:
+            return self.local_reports.pop(report_id, None) is not None
+        return await asyncio.to_thread(self._delete, report_id)
+    
+    async def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        if self.client is None:
+            return list(self.local_reports.items())
+        return await asyncio.to_thread(self._items)
+
+generated_reports = RedisReportStore(REDIS_URL)
 
 class ReportRequest(BaseModel):
     """Base model for report generation requests"""
@@ -102,9 +189,10 @@ class ReportDetailResponse(BaseModel):
     parameters: Dict[str, Any]
     metadata: Dict[str, Any]
 
+@lru_cache(maxsize=None)
 def get_database_connection():
-    """Get database connection"""
-    engine = create_engine(DATABASE_URL)
+    """Get database connection (one shared engine and pool per process)"""
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
     return engine
 
 def generate_web_page_content(report_data: Dict[str, Any]) -> str:
@@ -412,7 +500,7 @@ async def generate_market_report(request: MarketReportRequest):
         }
         
         # Store report
-        generated_reports[report_id] = report_data
+        await generated_reports.put(report_id, report_data)
         
         # Generate web URL
         web_url = f"/reports/view/{report_id}"
@@ -508,7 +596,7 @@ async def generate_cma_report(request: CMAReportRequest):
         }
         
         # Store report
-        generated_reports[report_id] = report_data
+        await generated_reports.put(report_id, report_data)
         
         # Generate web URL
         web_url = f"/reports/view/{report_id}"
@@ -553,7 +641,7 @@ async def generate_listing_presentation(request: ListingPresentationRequest):
         }
         
         # Store report
-        generated_reports[report_id] = report_data
+        await generated_reports.put(report_id, report_data)
         
         # Generate web URL
         web_url = f"/reports/view/{report_id}"
@@ -643,7 +731,7 @@ Both parties must sign this agreement for it to be legally binding.
         }
         
         # Store report
-        generated_reports[report_id] = report_data
+        await generated_reports.put(report_id, report_data)
         
         # Generate web URL
         web_url = f"/reports/view/{report_id}"
@@ -666,10 +754,9 @@ Both parties must sign this agreement for it to be legally binding.
 async def view_report(report_id: str):
     """View a generated report as a web page"""
     try:
-        if report_id not in generated_reports:
+        report_data = await generated_reports.get(report_id)
+        if report_data is None:
             raise HTTPException(status_code=404, detail="Report not found")
-        
-        report_data = generated_reports[report_id]
         html_content = generate_web_page_content(report_data)
         
         return HTMLResponse(content=html_content)
@@ -682,11 +769,10 @@ async def view_report(report_id: str):
 async def get_report_details(report_id: str):
     """Get detailed information about a generated report"""
     try:
-        if report_id not in generated_reports:
+        report_data = await generated_reports.get(report_id)
+        if report_data is None:
             raise HTTPException(status_code=404, detail="Report not found")
         
-        report_data = generated_reports[report_id]
-        
         return ReportDetailResponse(
             report_id=report_data["report_id"],
             title=report_data["title"],
@@ -707,7 +793,7 @@ async def list_reports():
     """List all generated reports"""
     try:
         reports = []
-        for report_id, report_data in generated_reports.items():
+        for report_id, report_data in await generated_reports.items():
             reports.append(ReportResponse(
                 report_id=report_data["report_id"],
                 title=report_data["title"],
@@ -728,11 +814,9 @@ async def list_reports():
 async def delete_report(report_id: str):
     """Delete a generated report"""
     try:
-        if report_id not in generated_reports:
+        if not await generated_reports.delete(report_id):
             raise HTTPException(status_code=404, detail="Report not found")
         
-        del generated_reports[report_id]
-        
         return {"message": "Report deleted successfully"}
         
     except Exception as e:
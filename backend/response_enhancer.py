@@ -10,6 +10,9 @@ This module enhances AI responses with:
 - Conversation continuity
 """
 
+import random
+import re
+from types import MappingProxyType
 from typing import Dict, Any, List
 try:
     from ai_enhancements import SentimentType
@@ -29,42 +32,131 @@ except ImportError:
             self.urgency_level = 1
             self.requires_follow_up = False
 
+# Follow-up questions offered after each intent. The suggestion tables below are
+# read-only views over tuples so every ResponseEnhancer can share them safely
+FOLLOW_UP_SUGGESTIONS = MappingProxyType({
+    'property_search': (
+        "Would you like me to show you similar properties in other areas?",
+        "Should I schedule a virtual tour for any of these properties?",
+        "Would you like to know more about the payment plans available?",
+        "Should I provide a detailed area analysis for the properties you're interested in?"
+    ),
+    'market_inquiry': (
+        "Would you like me to show you historical price trends?",
+        "Should I provide a detailed market analysis report?",
+        "Would you like to know about upcoming developments in this area?",
+        "Should I show you investment opportunities in this market?"
+    ),
+    'investment_advice': (
+        "Would you like me to calculate the potential ROI for specific properties?",
+        "Should I explain the Golden Visa requirements in detail?",
+        "Would you like to know about financing options for investors?",
+        "Should I show you the best investment areas in Dubai?"
+    ),
+    'legal_question': (
+        "Would you like me to explain the legal process in detail?",
+        "Should I connect you with our legal experts?",
+        "Would you like to know about the required documentation?",
+        "Should I provide a step-by-step legal guide?"
+    ),
+    'area_information': (
+        "Would you like me to show you properties in this area?",
+        "Should I provide a detailed area guide?",
+        "Would you like to know about schools and amenities?",
+        "Should I show you transport and connectivity options?"
+    ),
+    'transaction_help': (
+        "Would you like me to explain the complete buying process?",
+        "Should I show you the required documents?",
+        "Would you like to know about financing options?",
+        "Should I connect you with our transaction specialists?"
+    )
+})
+
+# Closing insight appended after each intent; one is picked at random per response
+DUBAI_INSIGHTS = MappingProxyType({
+    'property_search': (
+        "\n\n🏗️ **Dubai Market Insight**: Dubai's real estate market is currently experiencing strong growth with increasing demand for quality properties.",
+        "\n\n🌆 **Dubai Advantage**: Dubai offers tax-free returns, freehold ownership for foreigners, and world-class infrastructure.",
+        "\n\n📈 **Market Trend**: Dubai property prices have shown consistent appreciation, making it an attractive investment destination."
+    ),
+    'investment_advice': (
+        "\n\n💎 **Dubai Investment Edge**: Dubai offers unique advantages including Golden Visa eligibility, tax-free returns, and high rental yields.",
+        "\n\n🌍 **Global Appeal**: Dubai attracts international investors due to its strategic location, business-friendly environment, and luxury lifestyle.",
+        "\n\n📊 **ROI Potential**: Dubai properties typically offer 6-10% rental yields and 8-15% annual appreciation potential."
+    ),
+    'market_inquiry': (
+        "\n\n📊 **Dubai Market Overview**: Dubai's real estate market is driven by strong economic fundamentals, government initiatives, and international demand.",
+        "\n\n🏛️ **Government Support**: Dubai's government actively supports the real estate sector through various initiatives and regulations.",
+        "\n\n🌐 **Global Hub**: Dubai's position as a global business and tourism hub continues to drive property demand."
+    )
+})
+
+# Market insight lines offered by add_market_insights
+MARKET_INSIGHTS = MappingProxyType({
+    'property_search': (
+        "📈 **Current Market**: Dubai's property market is experiencing strong demand with increasing prices across all segments.",
+        "🏗️ **New Developments**: Several major projects are launching, offering excellent investment opportunities.",
+        "🌍 **International Demand**: Strong interest from international buyers, especially from Europe and Asia."
+    ),
+    'investment_advice': (
+        "💰 **Investment Climate**: Dubai offers excellent investment opportunities with high rental yields and capital appreciation.",
+        "🏛️ **Government Support**: Various government initiatives support real estate investment and foreign ownership.",
+        "📊 **Market Performance**: Dubai properties have shown consistent growth and strong returns over the past decade."
+    )
+})
+
+# Only the first suggestion per intent is surfaced, so format it once up front
+NEXT_STEPS = MappingProxyType({
+    intent: f"\n\n🤔 **Next Steps**: {suggestions[0]}"
+    for intent, suggestions in FOLLOW_UP_SUGGESTIONS.items()
+})
+
+# Opening lines for different scenarios
+RESPONSE_TEMPLATES = MappingProxyType({
+    'property_search': (
+        "Based on your requirements for {property_type} in {location}, I found several excellent options. Here are the top properties that match your criteria:",
+        "I've identified some great {property_type} properties in {location} that fit your budget and requirements. Let me show you the best options:",
+        "Perfect! I found {count} {property_type} properties in {location} that match your needs. Here are the highlights:"
+    ),
+    'market_inquiry': (
+        "The Dubai real estate market in {location} is currently showing {trend}. Here's what you need to know:",
+        "Great question! The {location} market is experiencing {trend}. Let me break down the current situation:",
+        "The market trends in {location} are quite interesting. Here's the latest analysis:"
+    ),
+    'investment_advice': (
+        "Excellent investment opportunity! The {location} area offers strong ROI potential. Here's my analysis:",
+        "Smart thinking! {location} is one of Dubai's best investment areas. Let me show you why:",
+        "For investment purposes, {location} is highly recommended. Here's the investment breakdown:"
+    ),
+    'confused_user': (
+        "I understand this can be confusing! Let me break this down in simple terms:",
+        "No worries! Let me explain this step by step in a way that's easy to understand:",
+        "I'll make this crystal clear for you. Here's what you need to know:"
+    ),
+    'excited_user': (
+        "I'm excited to help you with this! Here's everything you need to know:",
+        "Fantastic! This is a great opportunity. Let me get you all the details:",
+        "Excellent choice! I'm thrilled to assist you with this. Here's the complete information:"
+    )
+})
+
+# Keyword scans over user messages, matched case-insensitively in one pass
+_PROPERTY_MENTION_RE = re.compile(r"property|apartment|villa|house", re.IGNORECASE)
+_BUDGET_MENTION_RE = re.compile(r"budget|price|aed|dirham", re.IGNORECASE)
+
 class ResponseEnhancer:
     """Enhances AI responses for better quality and personalization"""
     
     def __init__(self, model):
         self.model = model
+        # Shared module-level tables; construction only binds references
         self.response_templates = self._load_response_templates()
+        self._next_steps_map = NEXT_STEPS
     
     def _load_response_templates(self) -> Dict[str, List[str]]:
         """Load response templates for different scenarios"""
-        return {
-            'property_search': [
-                "Based on your requirements for {property_type} in {location}, I found several excellent options. Here are the top properties that match your criteria:",
-                "I've identified some great {property_type} properties in {location} that fit your budget and requirements. Let me show you the best options:",
-                "Perfect! I found {count} {property_type} properties in {location} that match your needs. Here are the highlights:"
-            ],
-            'market_inquiry': [
-                "The Dubai real estate market in {location} is currently showing {trend}. Here's what you need to know:",
-                "Great question! The {location} market is experiencing {trend}. Let me break down the current situation:",
-                "The market trends in {location} are quite interesting. Here's the latest analysis:"
-            ],
-            'investment_advice': [
-                "Excellent investment opportunity! The {location} area offers strong ROI potential. Here's my analysis:",
-                "Smart thinking! {location} is one of Dubai's best investment areas. Let me show you why:",
-                "For investment purposes, {location} is highly recommended. Here's the investment breakdown:"
-            ],
-            'confused_user': [
-                "I understand this can be confusing! Let me break this down in simple terms:",
-                "No worries! Let me explain this step by step in a way that's easy to understand:",
-                "I'll make this crystal clear for you. Here's what you need to know:"
-            ],
-            'excited_user': [
-                "I'm excited to help you with this! Here's everything you need to know:",
-                "Fantastic! This is a great opportunity. Let me get you all the details:",
-                "Excellent choice! I'm thrilled to assist you with this. Here's the complete information:"
-            ]
-        }
+        return RESPONSE_TEMPLATES
     
     def enhance_response(self, 
                         base_response: str, 
@@ -139,48 +231,9 @@ class ResponseEnhancer:
     
     def _add_follow_up_suggestions(self, response: str, query_understanding: QueryUnderstanding) -> str:
         """Add follow-up suggestions based on query analysis"""
-        follow_ups = {
-            'property_search': [
-                "Would you like me to show you similar properties in other areas?",
-                "Should I schedule a virtual tour for any of these properties?",
-                "Would you like to know more about the payment plans available?",
-                "Should I provide a detailed area analysis for the properties you're interested in?"
-            ],
-            'market_inquiry': [
-                "Would you like me to show you historical price trends?",
-                "Should I provide a detailed market analysis report?",
-                "Would you like to know about upcoming developments in this area?",
-                "Should I show you investment opportunities in this market?"
-            ],
-            'investment_advice': [
-                "Would you like me to calculate the potential ROI for specific properties?",
-                "Should I explain the Golden Visa requirements in detail?",
-                "Would you like to know about financing options for investors?",
-                "Should I show you the best investment areas in Dubai?"
-            ],
-            'legal_question': [
-                "Would you like me to explain the legal process in detail?",
-                "Should I connect you with our legal experts?",
-                "Would you like to know about the required documentation?",
-                "Should I provide a step-by-step legal guide?"
-            ],
-            'area_information': [
-                "Would you like me to show you properties in this area?",
-                "Should I provide a detailed area guide?",
-                "Would you like to know about schools and amenities?",
-                "Should I show you transport and connectivity options?"
-            ],
-            'transaction_help': [
-                "Would you like me to explain the complete buying process?",
-                "Should I show you the required documents?",
-                "Would you like to know about financing options?",
-                "Should I connect you with our transaction specialists?"
-            ]
-        }
-        
-        intent_follow_ups = follow_ups.get(query_understanding.intent, [])
-        if intent_follow_ups:
-            response += f"\n\n🤔 **Next Steps**: {intent_follow_ups[0]}"
+        intent = query_understanding.intent
+        if intent in self._next_steps_map:
+            response += self._next_steps_map[intent]
         
         return response
     
@@ -194,11 +247,11 @@ class ResponseEnhancer:
             
             for msg in recent_messages:
                 if msg['role'] == 'user':
-                    content_lower = msg['content'].lower()
-                    if any(word in content_lower for word in ['property', 'apartment', 'villa', 'house']):
-                        property_mentions.append(msg['content'])
-                    if any(word in content_lower for word in ['budget', 'price', 'aed', 'dirham']):
-                        budget_mentions.append(msg['content'])
+                    content = msg['content']
+                    if _PROPERTY_MENTION_RE.search(content):
+                        property_mentions.append(content)
+                    if _BUDGET_MENTION_RE.search(content):
+                        budget_mentions.append(content)
             
             if property_mentions:
                 response += "\n\n📋 **Previous Discussion**: I remember you were interested in properties. Let me make sure this information builds on our previous conversation."
@@ -210,27 +263,8 @@ class ResponseEnhancer:
     
     def _add_dubai_context(self, response: str, query_understanding: QueryUnderstanding) -> str:
         """Add Dubai-specific context and insights"""
-        dubai_insights = {
-            'property_search': [
-                "\n\n🏗️ **Dubai Market Insight**: Dubai's real estate market is currently experiencing strong growth with increasing demand for quality properties.",
-                "\n\n🌆 **Dubai Advantage**: Dubai offers tax-free returns, freehold ownership for foreigners, and world-class infrastructure.",
-                "\n\n📈 **Market Trend**: Dubai property prices have shown consistent appreciation, making it an attractive investment destination."
-            ],
-            'investment_advice': [
-                "\n\n💎 **Dubai Investment Edge**: Dubai offers unique advantages including Golden Visa eligibility, tax-free returns, and high rental yields.",
-                "\n\n🌍 **Global Appeal**: Dubai attracts international investors due to its strategic location, business-friendly environment, and luxury lifestyle.",
-                "\n\n📊 **ROI Potential**: Dubai properties typically offer 6-10% rental yields and 8-15% annual appreciation potential."
-            ],
-            'market_inquiry': [
-                "\n\n📊 **Dubai Market Overview**: Dubai's real estate market is driven by strong economic fundamentals, government initiatives, and international demand.",
-                "\n\n🏛️ **Government Support**: Dubai's government actively supports the real estate sector through various initiatives and regulations.",
-                "\n\n🌐 **Global Hub**: Dubai's position as a global business and tourism hub continues to drive property demand."
-            ]
-        }
-        
-        intent_insights = dubai_insights.get(query_understanding.intent, [])
+        intent_insights = DUBAI_INSIGHTS.get(query_understanding.intent)
         if intent_insights:
-            import random
             response += random.choice(intent_insights)
         
         return response
@@ -243,13 +277,14 @@ class ResponseEnhancer:
         recommendations = []
         
         for location in user_preferences['preferred_locations'][:2]:
-            if 'dubai marina' in location.lower():
+            location_lower = location.lower()
+            if 'dubai marina' in location_lower:
                 recommendations.append("🏢 **Dubai Marina**: Luxury waterfront apartments with stunning views, excellent amenities, and strong rental demand.")
-            elif 'downtown' in location.lower():
+            elif 'downtown' in location_lower:
                 recommendations.append("🏙️ **Downtown Dubai**: Premium properties near Burj Khalifa with world-class shopping, dining, and entertainment.")
-            elif 'palm jumeirah' in location.lower():
+            elif 'palm jumeirah' in location_lower:
                 recommendations.append("🌴 **Palm Jumeirah**: Iconic waterfront villas and apartments with private beaches and luxury amenities.")
-            elif 'business bay' in location.lower():
+            elif 'business bay' in location_lower:
                 recommendations.append("🏢 **Business Bay**: Modern business district with contemporary apartments and excellent connectivity.")
         
         if recommendations:
@@ -259,22 +294,8 @@ class ResponseEnhancer:
     
     def add_market_insights(self, response: str, query_understanding: QueryUnderstanding) -> str:
         """Add relevant market insights"""
-        insights = {
-            'property_search': [
-                "📈 **Current Market**: Dubai's property market is experiencing strong demand with increasing prices across all segments.",
-                "🏗️ **New Developments**: Several major projects are launching, offering excellent investment opportunities.",
-                "🌍 **International Demand**: Strong interest from international buyers, especially from Europe and Asia."
-            ],
-            'investment_advice': [
-                "💰 **Investment Climate**: Dubai offers excellent investment opportunities with high rental yields and capital appreciation.",
-                "🏛️ **Government Support**: Various government initiatives support real estate investment and foreign ownership.",
-                "📊 **Market Performance**: Dubai properties have shown consistent growth and strong returns over the past decade."
-            ]
-        }
-        
-        intent_insights = insights.get(query_understanding.intent, [])
+        intent_insights = MARKET_INSIGHTS.get(query_understanding.intent)
         if intent_insights:
-            import random
             response += f"\n\n{random.choice(intent_insights)}"
         
         return response
@@ -4,8 +4,6 @@ Daily Briefing Scheduler for Dubai Real Estate RAG System
 This module handles the automated daily briefing generation for real estate agents
 """
 
-import os
-import sys
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
@@ -14,9 +12,6 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import asyncio
 
-# Add the backend directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from ai_manager import AIEnhancementManager
 from config.settings import DATABASE_URL, GOOGLE_API_KEY, AI_MODEL
 import google.generativeai as genai
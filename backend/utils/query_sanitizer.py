@@ -13,6 +13,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once here; the query builders run them on every call
+_SQL_LINE_COMMENT_RE = re.compile(r'--.*$', re.MULTILINE)
+_SQL_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+_SINGLE_QUOTED_RE = re.compile(r"'.*?'")
+_DOUBLE_QUOTED_RE = re.compile(r'".*?"')
+
 class QuerySanitizer:
     """Provides safe database query building and sanitization"""
     
@@ -29,8 +36,8 @@ class QuerySanitizer:
         
         if isinstance(value, str):
             # Remove any SQL comment patterns
-            value = re.sub(r'--.*$', '', value, flags=re.MULTILINE)
-            value = re.sub(r'/\*.*?\*/', '', value, flags=re.DOTALL)
+            value = _SQL_LINE_COMMENT_RE.sub('', value)
+            value = _SQL_BLOCK_COMMENT_RE.sub('', value)
             
             # Remove any semicolons that might be used for multiple statements
             value = value.replace(';', '')
@@ -53,7 +60,7 @@ class QuerySanitizer:
         try:
             # Sanitize inputs
             table = self.sanitize_input(table)
-            if not table or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table):
+            if not table or not _IDENTIFIER_RE.match(table):
                 raise ValueError("Invalid table name")
             
             # Build SELECT clause
@@ -70,7 +77,7 @@ class QuerySanitizer:
                 where_conditions = []
                 for key, value in conditions.items():
                     sanitized_key = self.sanitize_input(key)
-                    if not sanitized_key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', sanitized_key):
+                    if not sanitized_key or not _IDENTIFIER_RE.match(sanitized_key):
                         raise ValueError(f"Invalid column name: {key}")
                     
                     param_name = f"param_{len(params)}"
@@ -113,14 +120,14 @@ class QuerySanitizer:
         try:
             # Sanitize inputs
             table = self.sanitize_input(table)
-            if not table or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table):
+            if not table or not _IDENTIFIER_RE.match(table):
                 raise ValueError("Invalid table name")
             
             # Sanitize data
             sanitized_data = {}
             for key, value in data.items():
                 sanitized_key = self.sanitize_input(key)
-                if not sanitized_key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', sanitized_key):
+                if not sanitized_key or not _IDENTIFIER_RE.match(sanitized_key):
                     raise ValueError(f"Invalid column name: {key}")
                 sanitized_data[sanitized_key] = self.sanitize_input(value)
             
@@ -145,14 +152,14 @@ class QuerySanitizer:
         try:
             # Sanitize inputs
             table = self.sanitize_input(table)
-            if not table or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table):
+            if not table or not _IDENTIFIER_RE.match(table):
                 raise ValueError("Invalid table name")
             
             # Sanitize data
             sanitized_data = {}
             for key, value in data.items():
                 sanitized_key = self.sanitize_input(key)
-                if not sanitized_key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', sanitized_key):
+                if not sanitized_key or not _IDENTIFIER_RE.match(sanitized_key):
                     raise ValueError(f"Invalid column name: {key}")
                 sanitized_data[sanitized_key] = self.sanitize_input(value)
             
@@ -170,7 +177,7 @@ class QuerySanitizer:
             
             for key, value in conditions.items():
                 sanitized_key = self.sanitize_input(key)
-                if not sanitized_key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', sanitized_key):
+                if not sanitized_key or not _IDENTIFIER_RE.match(sanitized_key):
                     raise ValueError(f"Invalid column name in conditions: {key}")
                 
                 param_name = f"where_{sanitized_key}"
@@ -198,7 +205,7 @@ class QuerySanitizer:
         try:
             # Sanitize inputs
             table = self.sanitize_input(table)
-            if not table or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table):
+            if not table or not _IDENTIFIER_RE.match(table):
                 raise ValueError("Invalid table name")
             
             if not conditions:
@@ -210,7 +217,7 @@ class QuerySanitizer:
             
             for key, value in conditions.items():
                 sanitized_key = self.sanitize_input(key)
-                if not sanitized_key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', sanitized_key):
+                if not sanitized_key or not _IDENTIFIER_RE.match(sanitized_key):
                     raise ValueError(f"Invalid column name in conditions: {key}")
                 
                 param_name = f"param_{len(params)}"
@@ -230,7 +237,7 @@ class QuerySanitizer:
         """Validate that a query is safe"""
         try:
             # Check for unparameterized values
-            if re.search(r"'.*?'", query) or re.search(r'".*?"', query):
+            if _SINGLE_QUOTED_RE.search(query) or _DOUBLE_QUOTED_RE.search(query):
                 logger.warning("Query contains unparameterized string literals")
                 return False
             
@@ -0,0 +1,17 @@
+"""
+Password hashing for seeded demo accounts
+
+The seed scripts create users with fixed demo passwords that they print, so a low
+bcrypt cost is enough here. Application password hashing lives in auth.utils.
+"""
+
+import os
+import bcrypt
+
+DEFAULT_SEED_BCRYPT_ROUNDS = 4
+
+def hash_seed_password(password: str) -> str:
+    """Hash a demo password with bcrypt at SEED_BCRYPT_ROUNDS (read at call time, after .env is loaded)"""
+    rounds = int(os.getenv("SEED_BCRYPT_ROUNDS", DEFAULT_SEED_BCRYPT_ROUNDS))
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
@@ -33,12 +33,14 @@ class ConnectionManager:
             if not connection_id:
                 connection_id = str(uuid.uuid4())
             
+            now = datetime.utcnow()
+            
             # Store connection metadata
             self.connection_metadata[connection_id] = {
                 'user_id': user_id,
                 'websocket': websocket,
-                'connected_at': datetime.utcnow(),
-                'last_heartbeat': datetime.utcnow(),
+                'connected_at': now,
+                'last_heartbeat': now,
                 'ip_address': websocket.client.host if hasattr(websocket, 'client') else None,
                 'user_agent': websocket.headers.get('user-agent', 'Unknown')
             }
@@ -54,14 +56,14 @@ class ConnectionManager:
             self.user_connections[user_id].add(connection_id)
             
             # Store connection in database
-            await self._store_connection(user_id, connection_id, websocket)
+            await self._store_connection(user_id, connection_id, websocket, now)
             
             # Send welcome message
             await websocket.send_text(json.dumps({
                 'type': 'connection_established',
                 'connection_id': connection_id,
                 'user_id': user_id,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': now.isoformat(),
                 'message': 'Connected to Phase 4B AI Insights'
             }))
             
@@ -182,16 +184,18 @@ class ConnectionManager:
             message_type = message.get('type')
             
             if message_type == 'ping':
+                now = datetime.utcnow()
+                
                 # Respond to ping with pong
                 await websocket.send_text(json.dumps({
                     'type': 'pong',
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': now.isoformat()
                 }))
                 
                 # Update heartbeat
                 if connection_id in self.connection_metadata:
-                    self.connection_metadata[connection_id]['last_heartbeat'] = datetime.utcnow()
-                    await self._update_heartbeat(connection_id)
+                    self.connection_metadata[connection_id]['last_heartbeat'] = now
+                    await self._update_heartbeat(connection_id, now)
             
             elif message_type == 'mark_read':
                 # Mark notification as read
@@ -263,7 +267,7 @@ class ConnectionManager:
             logger.error(f"Error cleaning up stale connections: {e}")
     
     # Database operations
-    async def _store_connection(self, user_id: int, connection_id: str, websocket: WebSocket):
+    async def _store_connection(self, user_id: int, connection_id: str, websocket: WebSocket, connected_at: datetime = None):
         """Store WebSocket connection in database"""
         try:
             with get_db_connection() as conn:
@@ -281,7 +285,7 @@ class ConnectionManager:
                     'ip_address': websocket.client.host if hasattr(websocket, 'client') else None,
                     'user_agent': websocket.headers.get('user-agent', 'Unknown'),
                     'metadata': json.dumps({
-                        'connected_at': datetime.utcnow().isoformat(),
+                        'connected_at': (connected_at or datetime.utcnow()).isoformat(),
                         'protocol': 'websocket'
                     })
                 })
@@ -306,7 +310,7 @@ class ConnectionManager:
         except Exception as e:
             logger.error(f"Failed to update connection status: {e}")
     
-    async def _update_heartbeat(self, connection_id: str):
+    async def _update_heartbeat(self, connection_id: str, heartbeat: datetime = None):
         """Update connection heartbeat in database"""
         try:
             with get_db_connection() as conn:
@@ -315,7 +319,7 @@ class ConnectionManager:
                     SET last_heartbeat = :heartbeat
                     WHERE connection_id = :connection_id
                 """), {
-                    'heartbeat': datetime.utcnow(),
+                    'heartbeat': heartbeat or datetime.utcnow(),
                     'connection_id': connection_id
                 })
                 
@@ -7,32 +7,65 @@ Tests different user roles with various scenarios including simple queries and p
 import requests
 import json
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Union
 
 class RoleBasedRAGTester:
     def __init__(self, base_url: str = "http://localhost:8001"):
         self.base_url = base_url
         self.test_results = []
+        # Scenarios don't share state, so their chat requests can be in flight together
+        self.max_workers = 8
+        # One keep-alive pool for the whole run instead of a new connection per request
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.http.headers["Content-Type"] = "application/json"
     
-    def test_query_with_role(self, query: str, role: str, expected_indicators: List[str], test_name: str) -> Dict:
-        """Test a specific query with a specific role"""
+    def close(self):
+        """Release pooled connections"""
+        self.http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def _chat_body(query: str, role: str, session_id: str) -> bytes:
+        """Encoded /chat request body"""
+        return json.dumps({
+            "message": query,
+            "role": role,
+            "session_id": session_id
+        }).encode()
+    
+    def _send_query(self, body: bytes) -> Union[requests.Response, Exception]:
+        """Send one pre-encoded chat query; exceptions are returned so they can be reported in scenario order"""
+        try:
+            return self.http.post(f"{self.base_url}/chat", data=body, timeout=30)
+        except Exception as e:
+            return e
+    
+    def test_query_with_role(self, query: str, role: str, expected_indicators: List[str], test_name: str,
+                             outcome: Optional[Union[requests.Response, Exception]] = None) -> Dict:
+        """Test a specific query with a specific role (pass `outcome` if the request was already sent)"""
         print(f"\n{'='*60}")
         print(f"🧪 TESTING: {test_name}")
         print(f"👤 Role: {role}")
         print(f"📝 Query: {query}")
         print(f"{'='*60}")
         
+        if outcome is None:
+            outcome = self._send_query(self._chat_body(query, role, f"role_test_{role}_{int(time.time())}"))
+        
         try:
-            # Send query to the RAG system
-            response = requests.post(
-                f"{self.base_url}/chat",
-                json={
-                    "message": query,
-                    "role": role,
-                    "session_id": f"role_test_{role}_{int(time.time())}"
-                },
-                timeout=30
-            )
+            if isinstance(outcome, Exception):
+                raise outcome
+            response = outcome
             
             if response.status_code == 200:
                 result = response.json()
@@ -252,8 +285,19 @@ class RoleBasedRAGTester:
              "General Property Request - Client"),
         ]
         
-        for query, role, expected_indicators, test_name in test_scenarios:
-            self.test_query_with_role(query, role, expected_indicators, test_name)
+        # Fire the requests concurrently, then score and print them in scenario order.
+        # Each scenario gets its own session id so same-role queries don't share history.
+        batch_id = int(time.time())
+        # Bodies are encoded up front so the worker threads only do network I/O
+        bodies = [
+            self._chat_body(query, role, f"role_test_{role}_{batch_id}_{i}")
+            for i, (query, role, _, _) in enumerate(test_scenarios)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = list(executor.map(self._send_query, bodies))
+        
+        for (query, role, expected_indicators, test_name), outcome in zip(test_scenarios, outcomes):
+            self.test_query_with_role(query, role, expected_indicators, test_name, outcome)
         
         self.print_summary()
     
@@ -311,8 +355,8 @@ class RoleBasedRAGTester:
 
 def main():
     """Main function to run comprehensive role-based tests"""
-    tester = RoleBasedRAGTester()
-    tester.run_comprehensive_role_tests()
+    with RoleBasedRAGTester() as tester:
+        tester.run_comprehensive_role_tests()
 
 if __name__ == "__main__":
     main()
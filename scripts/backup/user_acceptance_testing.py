@@ -8,18 +8,53 @@ import os
 import sys
 import time
 import json
+import logging
+import logging.handlers
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Tuple
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Progress output is buffered and written in batches instead of one stdout write per line;
+# logging.shutdown() flushes whatever is left if the run aborts
+logger = logging.getLogger("user_acceptance_testing")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+output_buffer = logging.handlers.MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=_stdout_handler)
+logger.addHandler(output_buffer)
+
+@lru_cache(maxsize=None)
+def normalized_keywords(keywords: Tuple[str, ...]) -> frozenset:
+    """Lower-cased keyword set, built once per distinct scenario keyword list"""
+    return frozenset(keyword.lower() for keyword in keywords)
+
 class UserAcceptanceTestSuite:
     def __init__(self):
         self.api_base_url = "http://localhost:8001"
         self.test_results = []
         self.start_time = time.time()
+        # Per-test records are appended here as they finish; the summary file only holds aggregates
+        self.results_file = "test_results_user_acceptance.jsonl"
+        self._results_stream = None
+        
+        # Scenarios are independent, so run them concurrently over one pooled session
+        self.max_workers = 8
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
     def log_test(self, test_name: str, status: str, details: str = "", duration: float = 0):
         """Log test results"""
@@ -28,17 +63,66 @@ class UserAcceptanceTestSuite:
             "status": status,
             "details": details,
             "duration": duration,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_ns": time.time_ns()  # epoch ns; cheaper than formatting a datetime per record
         }
         self.test_results.append(result)
-        print(f"{'✅' if status == 'PASS' else '❌'} {test_name}: {status} ({duration:.3f}s)")
+        if self._results_stream is None:
+            self._results_stream = open(self.results_file, "w")
+        self._results_stream.write(json.dumps(result) + "\n")
+        logger.info(f"{'✅' if status == 'PASS' else '❌'} {test_name}: {status} ({duration:.3f}s)")
         if details:
-            print(f"   Details: {details}")
+            logger.info(f"   Details: {details}")
+    
+    def _run_scenario(self, scenario: Dict[str, Any], session_id: str) -> Tuple[str, str, float, bool]:
+        """Send one scenario query and score it; returns (status, details, duration, passed)"""
+        start_time = time.time()
+        try:
+            payload = {
+                "message": scenario["query"],
+                "role": scenario["role"],
+                "session_id": session_id
+            }
+            
+            response = self.session.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
+            duration = time.time() - start_time
+            
+            if response.status_code == 200:
+                data = response.json()
+                response_text = data.get("response", "").lower()
+                
+                # Check if response contains expected keywords
+                expected_keywords = normalized_keywords(tuple(scenario["expected_keywords"]))
+                keyword_matches = sum(1 for keyword in expected_keywords if keyword in response_text)
+                keyword_score = keyword_matches / len(expected_keywords)
+                
+                if keyword_score >= 0.6:  # At least 60% keyword coverage
+                    return "PASS", f"Response quality: {keyword_score:.1%} ({len(data['response'])} chars)", duration, True
+                return "PARTIAL", f"Response quality: {keyword_score:.1%} - needs improvement", duration, False
+            return "FAIL", f"HTTP {response.status_code}", duration, False
+                
+        except Exception as e:
+            duration = time.time() - start_time
+            return "FAIL", f"Error: {str(e)}", duration, False
+    
+    def _run_scenarios(self, scenarios: List[Dict[str, Any]], session_prefix: str) -> Dict[str, bool]:
+        """Run scenarios concurrently and log the results in scenario order"""
+        batch_id = int(time.time())
+        session_ids = [f"{session_prefix}_{batch_id}_{i}" for i in range(len(scenarios))]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = list(executor.map(self._run_scenario, scenarios, session_ids))
+        
+        results = {}
+        for scenario, (status, details, duration, passed) in zip(scenarios, outcomes):
+            self.log_test(scenario["name"], status, details, duration)
+            results[scenario["name"]] = passed
+        
+        return results
     
     def test_client_scenarios(self) -> Dict[str, bool]:
         """Test client-focused Dubai real estate scenarios"""
-        print("\n👤 Testing Client Scenarios:")
-        print("=" * 50)
+        logger.info("\n👤 Testing Client Scenarios:")
+        logger.info("=" * 50)
         
         client_scenarios = [
             {
@@ -78,52 +162,12 @@ class UserAcceptanceTestSuite:
             }
         ]
         
-        results = {}
-        
-        for scenario in client_scenarios:
-            start_time = time.time()
-            try:
-                payload = {
-                    "message": scenario["query"],
-                    "role": scenario["role"],
-                    "session_id": f"client_test_{int(time.time())}"
-                }
-                
-                response = requests.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    response_text = data.get("response", "").lower()
-                    
-                    # Check if response contains expected keywords
-                    keyword_matches = sum(1 for keyword in scenario["expected_keywords"] 
-                                        if keyword.lower() in response_text)
-                    keyword_score = keyword_matches / len(scenario["expected_keywords"])
-                    
-                    if keyword_score >= 0.6:  # At least 60% keyword coverage
-                        self.log_test(scenario["name"], "PASS", 
-                                    f"Response quality: {keyword_score:.1%} ({len(data['response'])} chars)", duration)
-                        results[scenario["name"]] = True
-                    else:
-                        self.log_test(scenario["name"], "PARTIAL", 
-                                    f"Response quality: {keyword_score:.1%} - needs improvement", duration)
-                        results[scenario["name"]] = False
-                else:
-                    self.log_test(scenario["name"], "FAIL", f"HTTP {response.status_code}", duration)
-                    results[scenario["name"]] = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(scenario["name"], "FAIL", f"Error: {str(e)}", duration)
-                results[scenario["name"]] = False
-        
-        return results
+        return self._run_scenarios(client_scenarios, "client_test")
     
     def test_agent_scenarios(self) -> Dict[str, bool]:
         """Test agent-focused Dubai real estate scenarios"""
-        print("\n🏢 Testing Agent Scenarios:")
-        print("=" * 50)
+        logger.info("\n🏢 Testing Agent Scenarios:")
+        logger.info("=" * 50)
         
         agent_scenarios = [
             {
@@ -163,52 +207,12 @@ class UserAcceptanceTestSuite:
             }
         ]
         
-        results = {}
-        
-        for scenario in agent_scenarios:
-            start_time = time.time()
-            try:
-                payload = {
-                    "message": scenario["query"],
-                    "role": scenario["role"],
-                    "session_id": f"agent_test_{int(time.time())}"
-                }
-                
-                response = requests.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    response_text = data.get("response", "").lower()
-                    
-                    # Check if response contains expected keywords
-                    keyword_matches = sum(1 for keyword in scenario["expected_keywords"] 
-                                        if keyword.lower() in response_text)
-                    keyword_score = keyword_matches / len(scenario["expected_keywords"])
-                    
-                    if keyword_score >= 0.6:
-                        self.log_test(scenario["name"], "PASS", 
-                                    f"Response quality: {keyword_score:.1%} ({len(data['response'])} chars)", duration)
-                        results[scenario["name"]] = True
-                    else:
-                        self.log_test(scenario["name"], "PARTIAL", 
-                                    f"Response quality: {keyword_score:.1%} - needs improvement", duration)
-                        results[scenario["name"]] = False
-                else:
-                    self.log_test(scenario["name"], "FAIL", f"HTTP {response.status_code}", duration)
-                    results[scenario["name"]] = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(scenario["name"], "FAIL", f"Error: {str(e)}", duration)
-                results[scenario["name"]] = False
-        
-        return results
+        return self._run_scenarios(agent_scenarios, "agent_test")
     
     def test_employee_scenarios(self) -> Dict[str, bool]:
         """Test employee-focused Dubai real estate scenarios"""
-        print("\n👷 Testing Employee Scenarios:")
-        print("=" * 50)
+        logger.info("\n👷 Testing Employee Scenarios:")
+        logger.info("=" * 50)
         
         employee_scenarios = [
             {
@@ -241,52 +245,12 @@ class UserAcceptanceTestSuite:
             }
         ]
         
-        results = {}
-        
-        for scenario in employee_scenarios:
-            start_time = time.time()
-            try:
-                payload = {
-                    "message": scenario["query"],
-                    "role": scenario["role"],
-                    "session_id": f"employee_test_{int(time.time())}"
-                }
-                
-                response = requests.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    response_text = data.get("response", "").lower()
-                    
-                    # Check if response contains expected keywords
-                    keyword_matches = sum(1 for keyword in scenario["expected_keywords"] 
-                                        if keyword.lower() in response_text)
-                    keyword_score = keyword_matches / len(scenario["expected_keywords"])
-                    
-                    if keyword_score >= 0.6:
-                        self.log_test(scenario["name"], "PASS", 
-                                    f"Response quality: {keyword_score:.1%} ({len(data['response'])} chars)", duration)
-                        results[scenario["name"]] = True
-                    else:
-                        self.log_test(scenario["name"], "PARTIAL", 
-                                    f"Response quality: {keyword_score:.1%} - needs improvement", duration)
-                        results[scenario["name"]] = False
-                else:
-                    self.log_test(scenario["name"], "FAIL", f"HTTP {response.status_code}", duration)
-                    results[scenario["name"]] = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(scenario["name"], "FAIL", f"Error: {str(e)}", duration)
-                results[scenario["name"]] = False
-        
-        return results
+        return self._run_scenarios(employee_scenarios, "employee_test")
     
     def test_admin_scenarios(self) -> Dict[str, bool]:
         """Test admin-focused Dubai real estate scenarios"""
-        print("\n🔧 Testing Admin Scenarios:")
-        print("=" * 50)
+        logger.info("\n🔧 Testing Admin Scenarios:")
+        logger.info("=" * 50)
         
         admin_scenarios = [
             {
@@ -312,52 +276,12 @@ class UserAcceptanceTestSuite:
             }
         ]
         
-        results = {}
-        
-        for scenario in admin_scenarios:
-            start_time = time.time()
-            try:
-                payload = {
-                    "message": scenario["query"],
-                    "role": scenario["role"],
-                    "session_id": f"admin_test_{int(time.time())}"
-                }
-                
-                response = requests.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
-                duration = time.time() - start_time
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    response_text = data.get("response", "").lower()
-                    
-                    # Check if response contains expected keywords
-                    keyword_matches = sum(1 for keyword in scenario["expected_keywords"] 
-                                        if keyword.lower() in response_text)
-                    keyword_score = keyword_matches / len(scenario["expected_keywords"])
-                    
-                    if keyword_score >= 0.6:
-                        self.log_test(scenario["name"], "PASS", 
-                                    f"Response quality: {keyword_score:.1%} ({len(data['response'])} chars)", duration)
-                        results[scenario["name"]] = True
-                    else:
-                        self.log_test(scenario["name"], "PARTIAL", 
-                                    f"Response quality: {keyword_score:.1%} - needs improvement", duration)
-                        results[scenario["name"]] = False
-                else:
-                    self.log_test(scenario["name"], "FAIL", f"HTTP {response.status_code}", duration)
-                    results[scenario["name"]] = False
-                    
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test(scenario["name"], "FAIL", f"Error: {str(e)}", duration)
-                results[scenario["name"]] = False
-        
-        return results
+        return self._run_scenarios(admin_scenarios, "admin_test")
     
     def test_response_quality_metrics(self) -> Dict[str, Any]:
         """Test response quality metrics"""
-        print("\n📊 Testing Response Quality Metrics:")
-        print("=" * 50)
+        logger.info("\n📊 Testing Response Quality Metrics:")
+        logger.info("=" * 50)
         
         quality_metrics = {
             "response_length": [],
@@ -374,38 +298,45 @@ class UserAcceptanceTestSuite:
             {"query": "How is the system performing?", "role": "admin"}
         ]
         
-        for scenario in test_scenarios:
+        def run_quality_scenario(scenario: Dict[str, str]):
             start_time = time.time()
+            payload = {
+                "message": scenario["query"],
+                "role": scenario["role"],
+                "session_id": f"quality_test_{int(time.time())}_{scenario['role']}"
+            }
+            
+            response = self.session.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
+            return response, time.time() - start_time
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(scenario, executor.submit(run_quality_scenario, scenario)) for scenario in test_scenarios]
+        
+        for scenario, future in futures:
             try:
-                payload = {
-                    "message": scenario["query"],
-                    "role": scenario["role"],
-                    "session_id": f"quality_test_{int(time.time())}"
-                }
-                
-                response = requests.post(f"{self.api_base_url}/chat", json=payload, timeout=30)
-                duration = time.time() - start_time
+                response, duration = future.result()
                 
                 if response.status_code == 200:
                     data = response.json()
                     response_text = data.get("response", "")
+                    response_lower = response_text.lower()
                     
                     # Collect metrics
                     quality_metrics["response_length"].append(len(response_text))
                     quality_metrics["response_time"].append(duration)
                     
                     # Check if response mentions the role
-                    role_mentioned = scenario["role"].lower() in response_text.lower()
+                    role_mentioned = scenario["role"].lower() in response_lower
                     quality_metrics["role_appropriateness"].append(1 if role_mentioned else 0)
                     
                     # Check keyword relevance (basic check)
                     query_words = scenario["query"].lower().split()
-                    relevant_words = sum(1 for word in query_words if word in response_text.lower())
+                    relevant_words = sum(1 for word in query_words if word in response_lower)
                     relevance_score = relevant_words / len(query_words) if query_words else 0
                     quality_metrics["keyword_relevance"].append(relevance_score)
                     
             except Exception as e:
-                print(f"Error in quality test: {str(e)}")
+                logger.info(f"Error in quality test: {str(e)}")
         
         # Calculate averages
         avg_metrics = {}
@@ -425,10 +356,10 @@ class UserAcceptanceTestSuite:
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all user acceptance tests"""
-        print("👥 Phase 5.1.3: User Acceptance Testing Suite")
-        print("=" * 60)
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        logger.info("👥 Phase 5.1.3: User Acceptance Testing Suite")
+        logger.info("=" * 60)
+        logger.info(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("")
         
         # Run all test scenarios
         client_results = self.test_client_scenarios()
@@ -446,31 +377,31 @@ class UserAcceptanceTestSuite:
         total_duration = time.time() - self.start_time
         
         # Print summary
-        print("\n" + "=" * 60)
-        print("📊 USER ACCEPTANCE TESTING SUMMARY")
-        print("=" * 60)
-        print(f"Total Tests: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"⚠️  Partial: {partial_tests}")
-        print(f"❌ Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests + partial_tests * 0.5) / total_tests * 100:.1f}%")
-        print(f"Total Duration: {total_duration:.2f}s")
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 USER ACCEPTANCE TESTING SUMMARY")
+        logger.info("=" * 60)
+        logger.info(f"Total Tests: {total_tests}")
+        logger.info(f"✅ Passed: {passed_tests}")
+        logger.info(f"⚠️  Partial: {partial_tests}")
+        logger.info(f"❌ Failed: {failed_tests}")
+        logger.info(f"Success Rate: {(passed_tests + partial_tests * 0.5) / total_tests * 100:.1f}%")
+        logger.info(f"Total Duration: {total_duration:.2f}s")
         
         # Role-specific results
-        print("\n📈 ROLE-SPECIFIC RESULTS:")
-        print("-" * 40)
-        print(f"Client Scenarios: {sum(client_results.values())}/{len(client_results)} passed")
-        print(f"Agent Scenarios: {sum(agent_results.values())}/{len(agent_results)} passed")
-        print(f"Employee Scenarios: {sum(employee_results.values())}/{len(employee_results)} passed")
-        print(f"Admin Scenarios: {sum(admin_results.values())}/{len(admin_results)} passed")
+        logger.info("\n📈 ROLE-SPECIFIC RESULTS:")
+        logger.info("-" * 40)
+        logger.info(f"Client Scenarios: {sum(client_results.values())}/{len(client_results)} passed")
+        logger.info(f"Agent Scenarios: {sum(agent_results.values())}/{len(agent_results)} passed")
+        logger.info(f"Employee Scenarios: {sum(employee_results.values())}/{len(employee_results)} passed")
+        logger.info(f"Admin Scenarios: {sum(admin_results.values())}/{len(admin_results)} passed")
         
         # Quality metrics summary
-        print("\n📊 QUALITY METRICS SUMMARY:")
-        print("-" * 40)
-        print(f"Average Response Length: {quality_metrics.get('response_length', 0):.0f} characters")
-        print(f"Average Response Time: {quality_metrics.get('response_time', 0):.3f} seconds")
-        print(f"Average Keyword Relevance: {quality_metrics.get('keyword_relevance', 0):.1%}")
-        print(f"Average Role Appropriateness: {quality_metrics.get('role_appropriateness', 0):.1%}")
+        logger.info("\n📊 QUALITY METRICS SUMMARY:")
+        logger.info("-" * 40)
+        logger.info(f"Average Response Length: {quality_metrics.get('response_length', 0):.0f} characters")
+        logger.info(f"Average Response Time: {quality_metrics.get('response_time', 0):.3f} seconds")
+        logger.info(f"Average Keyword Relevance: {quality_metrics.get('keyword_relevance', 0):.1%}")
+        logger.info(f"Average Role Appropriateness: {quality_metrics.get('role_appropriateness', 0):.1%}")
         
         # Save detailed results
         summary = {
@@ -489,14 +420,19 @@ class UserAcceptanceTestSuite:
                 "admin": admin_results
             },
             "quality_metrics": quality_metrics,
-            "detailed_results": self.test_results
+            "detailed_results_file": self.results_file
         }
         
         # Save to file
+        if self._results_stream is not None:
+            self._results_stream.close()
+            self._results_stream = None
         with open("test_results_user_acceptance.json", "w") as f:
             json.dump(summary, f, indent=2)
         
-        print(f"\n📄 Detailed results saved to: test_results_user_acceptance.json")
+        logger.info(f"\n📄 Summary saved to: test_results_user_acceptance.json")
+        logger.info(f"📄 Detailed results saved to: {self.results_file}")
+        output_buffer.flush()
         
         return summary
 
@@ -8,6 +8,8 @@ import sys
 import subprocess
 import shutil
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class ProductionDeployer:
@@ -17,21 +19,46 @@ class ProductionDeployer:
         self.frontend_dir = self.project_root / "frontend"
         self.deploy_dir = self.project_root / "deploy"
         
-    def run_command(self, cmd, cwd=None, check=True):
-        """Run a command and handle errors"""
+    def run_command(self, cmd, cwd=None, check=True, echo=False):
+        """Run a command and handle errors
+        
+        Output is read line by line as raw bytes and only the last 256 lines are kept,
+        so pip/npm installs don't buffer their whole log in memory. With echo=True the
+        bytes are passed straight through to our stdout. Only the tail is decoded: it
+        becomes the returned result's stdout (stderr is merged into it).
+        """
+        tail = deque(maxlen=256)
+        echo_out = getattr(sys.stdout, "buffer", None) if echo else None
+        if echo_out is not None:
+            sys.stdout.flush()  # keep earlier print() output ahead of the raw writes
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 cmd,
                 cwd=cwd or self.project_root,
-                capture_output=True,
-                text=True,
-                check=check
-            )
-            return result
-        except subprocess.CalledProcessError as e:
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=65536
+            ) as process:
+                for line in process.stdout:
+                    if echo_out is not None:
+                        echo_out.write(line)
+                    elif echo:
+                        print(line.decode(errors="replace"), end="")
+                    tail.append(line)
+                returncode = process.wait()
+            if echo_out is not None:
+                echo_out.flush()
+        except OSError as e:
             print(f"❌ Command failed: {' '.join(cmd)}")
-            print(f"Error: {e.stderr}")
+            print(f"Error: {e}")
             return None
+        
+        result = subprocess.CompletedProcess(cmd, returncode, stdout=b"".join(tail).decode(errors="replace"), stderr="")
+        if check and returncode != 0:
+            print(f"❌ Command failed: {' '.join(cmd)}")
+            print(f"Error: {result.stdout}")
+            return None
+        return result
     
     def check_prerequisites(self):
         """Check if all prerequisites are met"""
@@ -44,26 +71,21 @@ class ProductionDeployer:
             return False
         print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
         
-        # Check Node.js
-        node_result = self.run_command(["node", "--version"])
-        if not node_result:
-            print("❌ Node.js not found")
-            return False
-        print(f"✅ Node.js {node_result.stdout.strip()}")
+        # Presence is a PATH lookup; only installed tools are spawned, concurrently, for their version
+        tools = [("Node.js", ["node", "--version"]), ("npm", ["npm", "--version"]), ("Docker", ["docker", "--version"])]
+        for tool_name, cmd in tools:
+            if not shutil.which(cmd[0]):
+                print(f"❌ {tool_name} not found")
+                return False
         
-        # Check npm
-        npm_result = self.run_command(["npm", "--version"])
-        if not npm_result:
-            print("❌ npm not found")
-            return False
-        print(f"✅ npm {npm_result.stdout.strip()}")
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            results = list(executor.map(lambda tool: self.run_command(tool[1]), tools))
         
-        # Check Docker
-        docker_result = self.run_command(["docker", "--version"])
-        if not docker_result:
-            print("❌ Docker not found")
-            return False
-        print(f"✅ Docker {docker_result.stdout.strip()}")
+        for (tool_name, cmd), result in zip(tools, results):
+            if not result:
+                print(f"❌ {tool_name} is installed but '{' '.join(cmd)}' failed")
+                return False
+            print(f"✅ {tool_name} {result.stdout.strip()}")
         
         # Check environment file
         env_file = self.project_root / ".env"
@@ -74,14 +96,14 @@ class ProductionDeployer:
         
         return True
     
-    def setup_backend(self):
-        """Setup backend for production"""
+    def setup_backend(self, echo=True):
+        """Setup backend for production (echo=False keeps pip output quiet unless it fails)"""
         print("\n⚙️  Setting up backend...")
         
         # Install Python dependencies
         print("📦 Installing Python dependencies...")
         result = self.run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                                cwd=self.backend_dir)
+                                cwd=self.backend_dir, echo=echo)
         if not result:
             return False
         
@@ -112,19 +134,19 @@ SECRET_KEY=your-secret-key-here
         print("✅ Backend setup completed")
         return True
     
-    def setup_frontend(self):
-        """Setup frontend for production"""
+    def setup_frontend(self, echo=True):
+        """Setup frontend for production (echo=False keeps npm output quiet unless it fails)"""
         print("\n🌐 Setting up frontend...")
         
         # Install Node.js dependencies
         print("📦 Installing Node.js dependencies...")
-        result = self.run_command(["npm", "install"], cwd=self.frontend_dir)
+        result = self.run_command(["npm", "install"], cwd=self.frontend_dir, echo=echo)
         if not result:
             return False
         
         # Build for production
         print("🏗️  Building for production...")
-        result = self.run_command(["npm", "run", "build"], cwd=self.frontend_dir)
+        result = self.run_command(["npm", "run", "build"], cwd=self.frontend_dir, echo=echo)
         if not result:
             return False
         
@@ -537,13 +559,19 @@ docker rmi $(docker images -q)
             print("❌ Prerequisites not met")
             return False
         
-        # Setup backend
-        if not self.setup_backend():
+        # Setup backend (pip) and frontend (npm) at the same time; they touch separate
+        # directories and are both dominated by registry downloads. Their raw output would
+        # interleave on stdout, so it isn't echoed; run_command prints a failing step's tail.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backend_setup = executor.submit(self.setup_backend, echo=False)
+            frontend_setup = executor.submit(self.setup_frontend, echo=False)
+            backend_ok, frontend_ok = backend_setup.result(), frontend_setup.result()
+        
+        if not backend_ok:
             print("❌ Backend setup failed")
             return False
         
-        # Setup frontend
-        if not self.setup_frontend():
+        if not frontend_ok:
             print("❌ Frontend setup failed")
             return False
         
@@ -3,18 +3,69 @@
 Service startup script for Dubai Real Estate RAG System
 """
 
+import asyncio
 import subprocess
 import sys
 import os
 import time
+import select
 import signal
+import socket
 import psutil
 from typing import List, Dict
 
+# Delays between backend /health probes; ~6.4s in total before giving up
+HEALTH_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+
+# Printed in one write so it isn't interleaved with other output
+STARTUP_SUMMARY = (
+    "\n" + "=" * 50 + "\n"
+    "🎉 All services started successfully!\n"
+    "\n📋 Service URLs:\n"
+    "   Frontend: http://localhost:3000\n"
+    "   Backend:  http://localhost:8001\n"
+    "   ChromaDB: http://localhost:8000\n"
+    "\n💡 Press Ctrl+C to stop all services\n"
+)
+
 class ServiceManager:
     def __init__(self):
         self.processes: Dict[str, subprocess.Popen] = {}
+        self.log_files: Dict[str, object] = {}
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.log_dir = os.path.join(self.project_root, "logs")
+    
+    def spawn_service(self, name: str, cmd: List[str], cwd: str) -> subprocess.Popen:
+        """Start a long-running service with its output appended to logs/<name>.log.
+        
+        The output must go somewhere that is always drained: an unread PIPE blocks the
+        child as soon as the kernel pipe buffer fills with log lines.
+        """
+        os.makedirs(self.log_dir, exist_ok=True)
+        log_file = open(os.path.join(self.log_dir, f"{name}.log"), "ab")
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            bufsize=-1,
+            # Own process group: Ctrl+C reaches only us, and stop_all_services() can
+            # signal npm together with the node server it forks
+            start_new_session=(os.name != 'nt')
+        )
+        self.log_files[name] = log_file
+        self.processes[name] = process
+        return process
+    
+    def read_log_tail(self, name: str, max_bytes: int = 4096) -> str:
+        """Last few KB of a service log, for startup failure messages"""
+        try:
+            with open(os.path.join(self.log_dir, f"{name}.log"), "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode("utf-8", errors="replace")
+        except OSError:
+            return ""
         
     def start_postgresql(self) -> bool:
         """Start PostgreSQL service"""
@@ -95,26 +146,17 @@ class ServiceManager:
                 return True
             
             # Start backend
-            cmd = [sys.executable, "main.py"]
-            process = subprocess.Popen(
-                cmd,
-                cwd=backend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            process = self.spawn_service("backend", [sys.executable, "main.py"], backend_dir)
             
-            self.processes["backend"] = process
-            
-            # Wait a moment for startup
-            time.sleep(3)
-            
-            if process.poll() is None:
+            # Poll /health with backoff so we notice readiness as soon as it happens
+            if self.wait_for_health(process, "http://localhost:8001/health"):
                 print("✅ Backend started successfully")
                 return True
+            elif process.poll() is None:
+                print("⚠️  Backend is running but /health is not responding yet")
+                return True
             else:
-                stdout, stderr = process.communicate()
-                print(f"❌ Backend failed to start: {stderr}")
+                print(f"❌ Backend failed to start: {self.read_log_tail('backend')}")
                 return False
                 
         except Exception as e:
@@ -134,26 +176,18 @@ class ServiceManager:
                 return True
             
             # Start frontend
-            cmd = ["npm", "start"]
-            process = subprocess.Popen(
-                cmd,
-                cwd=frontend_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            process = self.spawn_service("frontend", ["npm", "start"], frontend_dir)
             
-            self.processes["frontend"] = process
-            
-            # Wait a moment for startup
-            time.sleep(5)
-            
-            if process.poll() is None:
+            # Wait until the dev server is actually listening instead of a fixed sleep
+            if self.wait_for_port(process, 3000, timeout=45):
                 print("✅ Frontend started successfully")
                 return True
+            elif process.poll() is None:
+                print("❌ Frontend did not open port 3000 within 45s")
+                self.signal_service(process)
+                return False
             else:
-                stdout, stderr = process.communicate()
-                print(f"❌ Frontend failed to start: {stderr}")
+                print(f"❌ Frontend failed to start: {self.read_log_tail('frontend')}")
                 return False
                 
         except Exception as e:
@@ -183,7 +217,6 @@ class ServiceManager:
     def is_port_in_use(self, port: int) -> bool:
         """Check if a port is in use"""
         try:
-            import socket
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.bind(('localhost', port))
                 return False
@@ -205,6 +238,117 @@ class ServiceManager:
             time.sleep(1)
         return False
     
+    def wait_for_health(self, process: subprocess.Popen, url: str) -> bool:
+        """Probe a freshly spawned service's health URL with exponential backoff"""
+        import requests
+        
+        for delay in HEALTH_POLL_DELAYS:
+            if process.poll() is not None:
+                return False
+            try:
+                if requests.get(url, timeout=1).status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(delay)
+        return False
+    
+    def wait_for_port(self, process: subprocess.Popen, port: int, timeout: float = 30) -> bool:
+        """Wait for a spawned service to accept TCP connections, backing off between probes"""
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
+            try:
+                with socket.create_connection(("localhost", port), timeout=0.5):
+                    return True
+            except OSError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+        return False
+    
+    async def _wait_readable(self, fd: int):
+        """Return once fd becomes readable, without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+    
+    async def watch_process(self, process: subprocess.Popen):
+        """Return once a managed process has exited"""
+        if hasattr(os, "pidfd_open"):  # Linux 5.3+: the pidfd becomes readable on exit
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+            if pidfd is not None:
+                try:
+                    await self._wait_readable(pidfd)
+                finally:
+                    os.close(pidfd)
+                process.poll()  # reap it
+                return
+        
+        if hasattr(select, "kqueue"):  # macOS/BSD: the kqueue fd becomes readable on NOTE_EXIT
+            kq = select.kqueue()
+            try:
+                kq.control([
+                    select.kevent(process.pid, filter=select.KQ_FILTER_PROC, flags=select.KQ_EV_ADD, fflags=select.KQ_NOTE_EXIT)
+                ], 0)
+                registered = True
+            except OSError:  # already exited (ESRCH) or refused
+                registered = False
+            try:
+                if registered:
+                    await self._wait_readable(kq.fileno())
+                    process.poll()  # reap it
+                    return
+            finally:
+                kq.close()
+        
+        # Fallback (Windows, or the kernel refused the pidfd/kqueue registration)
+        while process.poll() is None:
+            await asyncio.sleep(0.25)
+    
+    async def monitor_services(self):
+        """Wait until a managed process exits or Ctrl+C arrives.
+        
+        Returns the name of the process that exited, or None on interrupt. Further
+        periodic work can be added as another task in the same wait.
+        """
+        loop = asyncio.get_running_loop()
+        interrupted = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGINT, interrupted.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C still reaches signal_handler / KeyboardInterrupt
+        
+        watchers = {
+            asyncio.create_task(self.watch_process(process)): name
+            for name, process in self.processes.items()
+            if process.poll() is None
+        }
+        interrupt_task = asyncio.create_task(interrupted.wait())
+        try:
+            done, _ = await asyncio.wait([*watchers, interrupt_task], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in [*watchers, interrupt_task]:
+                task.cancel()
+            try:
+                loop.remove_signal_handler(signal.SIGINT)
+            except (NotImplementedError, RuntimeError):
+                pass
+        
+        for task in done:
+            if task in watchers:
+                return watchers[task]
+        return None
+    
     def start_all_services(self) -> bool:
         """Start all services"""
         print("🚀 Starting Dubai Real Estate RAG System...")
@@ -222,16 +366,24 @@ class ServiceManager:
                 print(f"❌ Failed to start {service_name}")
                 return False
         
-        print("\n" + "=" * 50)
-        print("🎉 All services started successfully!")
-        print("\n📋 Service URLs:")
-        print("   Frontend: http://localhost:3000")
-        print("   Backend:  http://localhost:8001")
-        print("   ChromaDB: http://localhost:8000")
-        print("\n💡 Press Ctrl+C to stop all services")
+        sys.stdout.write(STARTUP_SUMMARY)
+        sys.stdout.flush()
         
         return True
     
+    def signal_service(self, process: subprocess.Popen, force: bool = False):
+        """Terminate (or kill) a service's whole process group; just the process on Windows"""
+        if os.name == 'nt':
+            if force:
+                process.kill()
+            else:
+                process.terminate()
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # already gone
+    
     def stop_all_services(self):
         """Stop all services"""
         print("\n🛑 Stopping services...")
@@ -239,16 +391,19 @@ class ServiceManager:
         # Stop managed processes
         for name, process in self.processes.items():
             try:
-                process.terminate()
+                self.signal_service(process)
                 process.wait(timeout=5)
                 print(f"✅ Stopped {name}")
             except:
                 try:
-                    process.kill()
+                    self.signal_service(process, force=True)
                     print(f"⚠️  Force killed {name}")
                 except:
                     pass
         
+        for log_file in self.log_files.values():
+            log_file.close()
+        
         # Stop ChromaDB container
         try:
             subprocess.run(["docker", "stop", "chromadb"], capture_output=True)
@@ -277,9 +432,15 @@ def main():
         if manager.start_all_services():
             print("\n🔄 Services are running. Press Ctrl+C to stop.")
             
-            # Keep the script running
-            while True:
-                time.sleep(1)
+            # Sleep until a service dies or Ctrl+C arrives instead of polling every second
+            exited = asyncio.run(manager.monitor_services())
+            if exited is None:
+                print("\n🛑 Received interrupt signal")
+                manager.stop_all_services()
+                sys.exit(0)
+            print(f"❌ {exited} exited unexpectedly (exit code {manager.processes[exited].poll()})")
+            manager.stop_all_services()
+            sys.exit(1)
         else:
             print("❌ Failed to start all services")
             sys.exit(1)
@@ -10,7 +10,7 @@ from unittest.mock import patch, Mock
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
-from auth.models import User, Role, Permission, UserSession, AuditLog
+from auth.models import User, Role, Permission, UserSession, AuditLog, RoleCode
 from auth.database import Base, engine, SessionLocal
 from auth.utils import hash_password
 
@@ -129,6 +129,12 @@ class TestUserModel:
         
         assert user.full_name == "John Doe"
         
+    def test_user_role_code_property(self):
+        """Test role string maps to its integer role code."""
+        assert User(role="admin").role_code is RoleCode.ADMIN
+        assert User(role="agent").role_code is RoleCode.AGENT
+        assert User(role="unknown").role_code is None
+        
     def test_user_repr(self):
         """Test user string representation."""
         user = User(
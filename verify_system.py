@@ -8,6 +8,7 @@ import requests
 import json
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
 class SystemVerifier:
@@ -95,40 +96,29 @@ class SystemVerifier:
         print("🔍 Starting System Verification...")
         print("=" * 50)
         
-        # Core Health Checks
-        print("\n1. Core Health Checks")
-        self.results.append(self.test_endpoint("/health"))
-        self.results.append(self.test_endpoint("/phase3/health"))
-        
-        # Authentication Endpoints
-        print("\n2. Authentication Endpoints")
-        self.results.append(self.test_endpoint("/auth/me", auth_expected=True))
-        
-        # Session Management
-        print("\n3. Session Management")
-        self.results.append(self.test_endpoint("/sessions", auth_expected=True))
-        
-        # Phase 2 Endpoints
-        print("\n4. Phase 2 Endpoints")
-        self.results.append(self.test_endpoint("/users/me/agenda", auth_expected=True))
-        
-        # Phase 3A Endpoints
-        print("\n5. Phase 3A Endpoints")
-        self.results.append(self.test_endpoint("/phase3/ai/detect-entities", method="POST", 
-                                             data={"message": "Test message"}, auth_expected=True))
-        
-        # Properties Endpoints
-        print("\n6. Properties Endpoints")
-        self.results.append(self.test_endpoint("/properties"))
+        # The checks are independent, so send them all at once and report per section in order
+        sections = [
+            ("1. Core Health Checks", [("/health", {}), ("/phase3/health", {})]),
+            ("2. Authentication Endpoints", [("/auth/me", {"auth_expected": True})]),
+            ("3. Session Management", [("/sessions", {"auth_expected": True})]),
+            ("4. Phase 2 Endpoints", [("/users/me/agenda", {"auth_expected": True})]),
+            ("5. Phase 3A Endpoints", [("/phase3/ai/detect-entities", {"method": "POST",
+                                         "data": {"message": "Test message"}, "auth_expected": True})]),
+            ("6. Properties Endpoints", [("/properties", {})]),
+            ("7. Admin Endpoints", [("/admin/files", {"auth_expected": True})]),
+            ("8. Additional Phase 3 Endpoints", [("/phase3/context/property/test", {"auth_expected": True}),
+                                                 ("/phase3/properties/test/details", {"auth_expected": True})]),
+        ]
         
-        # Admin Endpoints
-        print("\n7. Admin Endpoints")
-        self.results.append(self.test_endpoint("/admin/files", auth_expected=True))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                (title, [executor.submit(self.test_endpoint, endpoint, **kwargs) for endpoint, kwargs in checks])
+                for title, checks in sections
+            ]
         
-        # Additional Phase 3 endpoints
-        print("\n8. Additional Phase 3 Endpoints")
-        self.results.append(self.test_endpoint("/phase3/context/property/test", auth_expected=True))
-        self.results.append(self.test_endpoint("/phase3/properties/test/details", auth_expected=True))
+        for title, section_futures in futures:
+            print(f"\n{title}")
+            self.results.extend(future.result() for future in section_futures)
         
         return self.results
     